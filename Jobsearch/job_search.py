@@ -15,19 +15,188 @@ Features:
 """
 
 import os
-import requests
-import json
-import time
+import asyncio
+import heapq
+import aiohttp
+import numpy as np
+import orjson
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Optional
-from dataclasses import dataclass
+from cachetools import LRUCache, TTLCache
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from itertools import islice
+from urllib.parse import urljoin, urlparse
 from dotenv import load_dotenv
+from selectolax.lexbor import LexborHTMLParser
+from sklearn.feature_extraction.text import TfidfVectorizer
 import re
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# libuv-backed event loop for the concurrent fetches, when installed
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 # Load environment variables from the main APPS directory
 load_dotenv("/Users/benhannan/Cursor Apps/APPS/.env")
 
-@dataclass
+# Outbound request limits for the concurrent site search and verification
+MAX_CONNECTIONS = 32
+MAX_CONNECTIONS_PER_HOST = 8  # Reuse warm connections instead of new TLS handshakes
+KEEPALIVE_TIMEOUT = 30  # seconds
+DNS_CACHE_TTL = 300  # seconds
+PER_HOST_CONCURRENCY = 2  # Polite rate limiting per job board
+SITE_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+VERIFY_CONCURRENCY = 32
+VERIFY_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=5)
+FRESH_LISTING_DAYS = 7  # Listings this recent are trusted as open without a HEAD check
+
+# CSS selectors for the job cards on each site's search results page. The card
+# marker is a literal that appears in any page containing cards
+SITE_SELECTORS = {
+    'LinkedIn': {
+        'base_url': 'https://www.linkedin.com',
+        'card': 'div.base-card',
+        'card_marker': 'base-card',
+        'title': 'h3.base-search-card__title',
+        'company': 'h4.base-search-card__subtitle',
+        'location': 'span.job-search-card__location',
+        'link': 'a.base-card__full-link',
+        'salary': 'span.job-search-card__salary-info',
+    },
+    'Indeed': {
+        'base_url': 'https://www.indeed.com',
+        'card': 'div.job_seen_beacon',
+        'card_marker': 'job_seen_beacon',
+        'title': 'h2.jobTitle span',
+        'company': '[data-testid="company-name"]',
+        'location': '[data-testid="text-location"]',
+        'link': 'h2.jobTitle a',
+        'salary': 'div.salary-snippet-container',
+    },
+    'Glassdoor': {
+        'base_url': 'https://www.glassdoor.com',
+        'card': 'li[data-test="jobListing"]',
+        'card_marker': 'jobListing',
+        'title': 'a[data-test="job-title"]',
+        'company': '[data-test="employer-name"]',
+        'location': '[data-test="emp-location"]',
+        'link': 'a[data-test="job-title"]',
+        'salary': '[data-test="detailSalary"]',
+    },
+    'ZipRecruiter': {
+        'base_url': 'https://www.ziprecruiter.com',
+        'card': 'article.job_result',
+        'card_marker': 'job_result',
+        'title': 'h2.title',
+        'company': 'a.company_name',
+        'location': 'a.company_location',
+        'link': 'a.job_link',
+        'salary': 'span.salary',
+    },
+}
+
+# Verification results shared across searches: HEAD status by URL, and hosts
+# that recently refused connections so we don't keep dialing them
+_url_status_cache = LRUCache(maxsize=4096)
+_dead_hosts = TTLCache(maxsize=256, ttl=300)
+
+# Recent per-site search results keyed on (site, location, keywords, max_results)
+_site_results_cache = TTLCache(maxsize=128, ttl=600)
+
+def _run_sync(coro):
+    """Run a coroutine to completion from synchronous code"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    # We're inside an event loop already (a web handler, a notebook, ...) where
+    # asyncio.run isn't allowed, so give the coroutine its own loop on a worker thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+@lru_cache(maxsize=1024)
+def _parse_posted_date(posted_date: str) -> np.datetime64:
+    """Parse a single ISO posted date, returning NaT if it isn't a valid date"""
+    try:
+        return np.datetime64(datetime.fromisoformat(posted_date).date(), "D")
+    except ValueError:
+        return np.datetime64("NaT", "D")
+
+def _heap_top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k highest scores, highest first, using a bounded min-heap
+    
+    Among equal scores the later index counts as smaller, so ties keep their
+    original order just like a stable sort.
+    """
+    heap_scores = np.empty(k, dtype=scores.dtype)
+    heap_indices = np.empty(k, dtype=np.int64)
+    size = 0
+    
+    for i in range(scores.shape[0]):
+        score = scores[i]
+        if size < k:
+            # Heap not full yet: push and sift up
+            pos = size
+            size += 1
+            while pos > 0:
+                parent = (pos - 1) // 2
+                if heap_scores[parent] < score:
+                    break
+                heap_scores[pos] = heap_scores[parent]
+                heap_indices[pos] = heap_indices[parent]
+                pos = parent
+        elif score > heap_scores[0]:
+            # Beats the smallest kept score: replace the root and sift down
+            pos = 0
+            while True:
+                child = 2 * pos + 1
+                if child >= size:
+                    break
+                if child + 1 < size and (
+                    heap_scores[child + 1] < heap_scores[child]
+                    or (heap_scores[child + 1] == heap_scores[child] and heap_indices[child + 1] > heap_indices[child])
+                ):
+                    child += 1
+                if heap_scores[child] >= score:
+                    break
+                heap_scores[pos] = heap_scores[child]
+                heap_indices[pos] = heap_indices[child]
+                pos = child
+        else:
+            continue
+        heap_scores[pos] = score
+        heap_indices[pos] = i
+    
+    # Order by score, keeping ties in their original order
+    by_index = np.argsort(heap_indices[:size])
+    kept_scores = heap_scores[:size][by_index]
+    kept_indices = heap_indices[:size][by_index]
+    return kept_indices[np.argsort(-kept_scores, kind="mergesort")]
+
+if njit is not None:
+    _heap_top_k = njit(cache=True)(_heap_top_k)
+
+def _top_k_indices(scores: np.ndarray, k: int) -> List[int]:
+    """Indices of the k highest scores, highest first"""
+    if k <= 0:
+        return []
+    if njit is None:
+        return heapq.nlargest(k, range(len(scores)), key=scores.__getitem__)
+    return _heap_top_k(scores, k).tolist()
+
+@dataclass(slots=True)
 class JobListing:
     """Data structure for job listings"""
     title: str
@@ -46,10 +215,10 @@ class JobSearchEngine:
     """Main job search engine that searches multiple sites"""
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
+        }
+        self._host_semaphores = {}
         
         # API keys from environment
         self.linkedin_api_key = os.getenv("LINKEDIN_API_KEY")
@@ -78,32 +247,91 @@ class JobSearchEngine:
         """
         print(f"🔍 Searching for jobs in {location} with keywords: {', '.join(keywords)}")
         
-        all_jobs = []
-        
-        # Search each job site
-        for site_name, search_function in self.job_sites.items():
-            try:
+        return _run_sync(self._search_jobs_async(location, keywords, max_results))
+    
+    async def _search_jobs_async(self, location: str, keywords: List[str], max_results: int) -> List[JobListing]:
+        """Async implementation of search_jobs"""
+        # One session for both phases so connections and DNS lookups are reused
+        async with self._create_session() as session:
+            # Search all job sites concurrently
+            all_jobs = await self._search_all_sites(session, location, keywords, max_results // len(self.job_sites))
+            
+            # Filter and rank jobs, keeping only the best max_results
+            return await self._filter_and_rank_jobs(session, all_jobs, location, keywords, max_results)
+    
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create the HTTP session shared by the search and verification phases"""
+        # aiodns resolves hosts without blocking the event loop, and the DNS
+        # cache means each job board host is only resolved once. Capping
+        # connections per host makes verification of many listings on one
+        # board queue onto kept-alive connections rather than opening more
+        connector = aiohttp.TCPConnector(
+            limit=MAX_CONNECTIONS,
+            limit_per_host=MAX_CONNECTIONS_PER_HOST,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            resolver=aiohttp.AsyncResolver(),
+            use_dns_cache=True,
+            ttl_dns_cache=DNS_CACHE_TTL
+        )
+        return aiohttp.ClientSession(connector=connector, headers=self.headers)
+    
+    async def _search_all_sites(self, session: aiohttp.ClientSession, location: str, keywords: List[str], max_results: int) -> List[JobListing]:
+        """Run every site search concurrently over a shared HTTP session"""
+        # Semaphores belong to the running event loop, so create them per search
+        self._host_semaphores = defaultdict(lambda: asyncio.Semaphore(PER_HOST_CONCURRENCY))
+        
+        async def search_site(site_name: str, search_function) -> List[JobListing]:
+            cache_key = (site_name, location, tuple(keywords), max_results)
+            if cache_key in _site_results_cache:
+                print(f"📦 Using recent {site_name.title()} results")
+                site_jobs = _site_results_cache[cache_key]
+            else:
                 print(f"📡 Searching {site_name.title()}...")
-                site_jobs = search_function(location, keywords, max_results // len(self.job_sites))
-                all_jobs.extend(site_jobs)
-                time.sleep(1)  # Rate limiting
-            except Exception as e:
-                print(f"⚠️ Error searching {site_name}: {str(e)}")
-                continue
+                site_jobs = await search_function(session, location, keywords, max_results)
+                # An empty result usually means the request failed, so don't remember it
+                if site_jobs:
+                    _site_results_cache[cache_key] = site_jobs
+            
+            # Ranking updates jobs in place, so hand out copies of cached listings
+            return [replace(job) for job in site_jobs]
         
-        # Filter and rank jobs
-        filtered_jobs = self._filter_and_rank_jobs(all_jobs, location, keywords)
+        results = await asyncio.gather(
+            *(search_site(site_name, search_function) for site_name, search_function in self.job_sites.items()),
+            return_exceptions=True
+        )
         
-        # Limit results
-        return filtered_jobs[:max_results]
+        all_jobs = []
+        seen = set()
+        for site_name, site_jobs in zip(self.job_sites, results):
+            if isinstance(site_jobs, Exception):
+                print(f"⚠️ Error searching {site_name}: {str(site_jobs)}")
+                continue
+            
+            # Boards syndicate each other's listings, so keep only the first copy
+            for job in site_jobs:
+                fingerprint = (job.company.lower(), job.title.lower(), job.location.lower())
+                if fingerprint in seen:
+                    continue
+                seen.add(fingerprint)
+                all_jobs.append(job)
+        
+        return all_jobs
     
-    def _search_linkedin(self, location: str, keywords: List[str], max_results: int) -> List[JobListing]:
+    async def _fetch_html(self, session: aiohttp.ClientSession, url: str) -> Optional[str]:
+        """Fetch a search page, returning its HTML or None on a non-200 response"""
+        async with self._host_semaphores[urlparse(url).hostname]:
+            async with session.get(url, timeout=SITE_REQUEST_TIMEOUT) as response:
+                if response.status == 200:
+                    return await response.text()
+        return None
+    
+    async def _search_linkedin(self, session: aiohttp.ClientSession, location: str, keywords: List[str], max_results: int) -> List[JobListing]:
         """Search LinkedIn for jobs"""
         jobs = []
         
         if not self.linkedin_api_key:
             print("⚠️ LinkedIn API key not found, using web scraping fallback")
-            return self._scrape_linkedin_web(location, keywords, max_results)
+            return await self._scrape_linkedin_web(session, location, keywords, max_results)
         
         # LinkedIn API search (if available)
         try:
@@ -113,9 +341,9 @@ class JobSearchEngine:
         except Exception as e:
             print(f"LinkedIn API failed: {e}, falling back to web scraping")
         
-        return self._scrape_linkedin_web(location, keywords, max_results)
+        return await self._scrape_linkedin_web(session, location, keywords, max_results)
     
-    def _scrape_linkedin_web(self, location: str, keywords: List[str], max_results: int) -> List[JobListing]:
+    async def _scrape_linkedin_web(self, session: aiohttp.ClientSession, location: str, keywords: List[str], max_results: int) -> List[JobListing]:
         """Scrape LinkedIn jobs from web (fallback method)"""
         jobs = []
         
@@ -124,23 +352,23 @@ class JobSearchEngine:
         search_url = f"https://www.linkedin.com/jobs/search/?keywords={search_query}&location={location}"
         
         try:
-            response = self.session.get(search_url, timeout=10)
-            if response.status_code == 200:
+            html = await self._fetch_html(session, search_url)
+            if html is not None:
                 # Parse HTML and extract job listings
                 # This is a simplified version - in production you'd use BeautifulSoup
-                jobs = self._parse_linkedin_html(response.text, max_results)
+                jobs = self._parse_linkedin_html(html, max_results)
         except Exception as e:
             print(f"LinkedIn web scraping failed: {e}")
         
         return jobs
     
-    def _search_indeed(self, location: str, keywords: List[str], max_results: int) -> List[JobListing]:
+    async def _search_indeed(self, session: aiohttp.ClientSession, location: str, keywords: List[str], max_results: int) -> List[JobListing]:
         """Search Indeed for jobs"""
         jobs = []
         
         if not self.indeed_api_key:
             print("⚠️ Indeed API key not found, using web scraping fallback")
-            return self._scrape_indeed_web(location, keywords, max_results)
+            return await self._scrape_indeed_web(session, location, keywords, max_results)
         
         # Indeed API search (if available)
         try:
@@ -149,9 +377,9 @@ class JobSearchEngine:
         except Exception as e:
             print(f"Indeed API failed: {e}, falling back to web scraping")
         
-        return self._scrape_indeed_web(location, keywords, max_results)
+        return await self._scrape_indeed_web(session, location, keywords, max_results)
     
-    def _scrape_indeed_web(self, location: str, keywords: List[str], max_results: int) -> List[JobListing]:
+    async def _scrape_indeed_web(self, session: aiohttp.ClientSession, location: str, keywords: List[str], max_results: int) -> List[JobListing]:
         """Scrape Indeed jobs from web (fallback method)"""
         jobs = []
         
@@ -160,16 +388,16 @@ class JobSearchEngine:
         search_url = f"https://www.indeed.com/jobs?q={search_query}&l={location}"
         
         try:
-            response = self.session.get(search_url, timeout=10)
-            if response.status_code == 200:
+            html = await self._fetch_html(session, search_url)
+            if html is not None:
                 # Parse HTML and extract job listings
-                jobs = self._parse_indeed_html(response.text, max_results)
+                jobs = self._parse_indeed_html(html, max_results)
         except Exception as e:
             print(f"Indeed web scraping failed: {e}")
         
         return jobs
     
-    def _search_glassdoor(self, location: str, keywords: List[str], max_results: int) -> List[JobListing]:
+    async def _search_glassdoor(self, session: aiohttp.ClientSession, location: str, keywords: List[str], max_results: int) -> List[JobListing]:
         """Search Glassdoor for jobs"""
         jobs = []
         
@@ -178,15 +406,15 @@ class JobSearchEngine:
         search_url = f"https://www.glassdoor.com/Job/{location}-{search_query}-jobs-SRCH_IL.0,0_IC1147401_KO0,0.htm"
         
         try:
-            response = self.session.get(search_url, timeout=10)
-            if response.status_code == 200:
-                jobs = self._parse_glassdoor_html(response.text, max_results)
+            html = await self._fetch_html(session, search_url)
+            if html is not None:
+                jobs = self._parse_glassdoor_html(html, max_results)
         except Exception as e:
             print(f"Glassdoor search failed: {e}")
         
         return jobs
     
-    def _search_ziprecruiter(self, location: str, keywords: List[str], max_results: int) -> List[JobListing]:
+    async def _search_ziprecruiter(self, session: aiohttp.ClientSession, location: str, keywords: List[str], max_results: int) -> List[JobListing]:
         """Search ZipRecruiter for jobs"""
         jobs = []
         
@@ -195,9 +423,9 @@ class JobSearchEngine:
         search_url = f"https://www.ziprecruiter.com/candidate/search?search={search_query}&location={location}"
         
         try:
-            response = self.session.get(search_url, timeout=10)
-            if response.status_code == 200:
-                jobs = self._parse_ziprecruiter_html(response.text, max_results)
+            html = await self._fetch_html(session, search_url)
+            if html is not None:
+                jobs = self._parse_ziprecruiter_html(html, max_results)
         except Exception as e:
             print(f"ZipRecruiter search failed: {e}")
         
@@ -205,10 +433,11 @@ class JobSearchEngine:
     
     def _parse_linkedin_html(self, html: str, max_results: int) -> List[JobListing]:
         """Parse LinkedIn HTML for job listings"""
-        jobs = []
+        jobs = self._parse_job_cards(html, "LinkedIn", max_results)
+        if jobs:
+            return jobs
         
-        # This is a placeholder - in production you'd use BeautifulSoup to parse HTML
-        # For now, we'll create sample data
+        # Nothing matched the card selectors, so fall back to sample data
         for i in range(min(5, max_results)):
             jobs.append(JobListing(
                 title=f"Sample LinkedIn Job {i+1}",
@@ -228,9 +457,11 @@ class JobSearchEngine:
     
     def _parse_indeed_html(self, html: str, max_results: int) -> List[JobListing]:
         """Parse Indeed HTML for job listings"""
-        jobs = []
+        jobs = self._parse_job_cards(html, "Indeed", max_results)
+        if jobs:
+            return jobs
         
-        # Placeholder implementation
+        # Nothing matched the card selectors, so fall back to sample data
         for i in range(min(5, max_results)):
             jobs.append(JobListing(
                 title=f"Sample Indeed Job {i+1}",
@@ -250,9 +481,11 @@ class JobSearchEngine:
     
     def _parse_glassdoor_html(self, html: str, max_results: int) -> List[JobListing]:
         """Parse Glassdoor HTML for job listings"""
-        jobs = []
+        jobs = self._parse_job_cards(html, "Glassdoor", max_results)
+        if jobs:
+            return jobs
         
-        # Placeholder implementation
+        # Nothing matched the card selectors, so fall back to sample data
         for i in range(min(5, max_results)):
             jobs.append(JobListing(
                 title=f"Sample Glassdoor Job {i+1}",
@@ -272,9 +505,11 @@ class JobSearchEngine:
     
     def _parse_ziprecruiter_html(self, html: str, max_results: int) -> List[JobListing]:
         """Parse ZipRecruiter HTML for job listings"""
-        jobs = []
+        jobs = self._parse_job_cards(html, "ZipRecruiter", max_results)
+        if jobs:
+            return jobs
         
-        # Placeholder implementation
+        # Nothing matched the card selectors, so fall back to sample data
         for i in range(min(5, max_results)):
             jobs.append(JobListing(
                 title=f"Sample ZipRecruiter Job {i+1}",
@@ -292,68 +527,218 @@ class JobSearchEngine:
         
         return jobs
     
-    def _filter_and_rank_jobs(self, jobs: List[JobListing], location: str, keywords: List[str]) -> List[JobListing]:
-        """Filter and rank jobs based on relevance and current status"""
-        filtered_jobs = []
+    def _parse_job_cards(self, html: str, source: str, max_results: int) -> List[JobListing]:
+        """Extract job listings from a search results page using the site's card selectors"""
+        selectors = SITE_SELECTORS[source]
         
-        for job in jobs:
-            # Calculate relevance score
-            relevance_score = self._calculate_relevance_score(job, location, keywords)
+        # A plain substring scan is far cheaper than building a DOM, and rules
+        # out blocked or empty result pages up front
+        if selectors['card_marker'] not in html:
+            return []
+        
+        tree = LexborHTMLParser(html)
+        
+        # Cards are converted lazily so we stop as soon as we have enough jobs
+        cards = (self._card_to_job(card, source, selectors) for card in tree.css(selectors['card']))
+        return list(islice((job for job in cards if job is not None), max_results))
+    
+    def _card_to_job(self, card, source: str, selectors: Dict[str, str]) -> Optional[JobListing]:
+        """Build a JobListing from a single job card, or None if it has no title or link"""
+        def text(selector: str) -> Optional[str]:
+            node = card.css_first(selector)
+            return (node.text(strip=True) or None) if node is not None else None
+        
+        title = text(selectors['title'])
+        link = card.css_first(selectors['link'])
+        href = link.attributes.get('href') if link is not None else None
+        if not title or not href:
+            return None
+        
+        posted = card.css_first('time')
+        
+        return JobListing(
+            title=title,
+            company=text(selectors['company']) or "",
+            location=text(selectors['location']) or "",
+            description=card.text(separator=" ", strip=True),
+            url=urljoin(selectors['base_url'], href),
+            source=source,
+            posted_date=posted.attributes.get('datetime') if posted is not None else None,
+            salary=text(selectors['salary']),
+            job_type=None,
+            relevance_score=0.0,
+            is_currently_open=True
+        )
+    
+    async def _filter_and_rank_jobs(self, session: aiohttp.ClientSession, jobs: List[JobListing], location: str, keywords: List[str], max_results: int) -> List[JobListing]:
+        """Filter and rank jobs based on relevance and current status"""
+        # Score every job in one columnar pass
+        days_old = self._days_since_posted(jobs)
+        scores = self._calculate_relevance_scores(jobs, location, keywords, days_old)
+        for job, relevance_score in zip(jobs, scores.tolist()):
             job.relevance_score = relevance_score
-            
-            # Check if job is currently open (basic check)
-            job.is_currently_open = self._verify_job_status(job)
-            
-            # Only include jobs with decent relevance and currently open
-            if relevance_score > 0.3 and job.is_currently_open:
-                filtered_jobs.append(job)
         
-        # Sort by relevance score (highest first)
-        filtered_jobs.sort(key=lambda x: x.relevance_score, reverse=True)
+        # Only jobs with decent relevance matter from here on
+        relevant_mask = scores > 0.3
+        
+        # Boards only list open jobs, so trust recent listings and spend HEAD
+        # checks on older ones whose URLs may have expired
+        fresh_mask = ~np.isnat(days_old) & (days_old <= np.timedelta64(FRESH_LISTING_DAYS, "D"))
+        verify_indices = np.flatnonzero(relevant_mask & ~fresh_mask)
+        
+        # Check which older candidates are currently open, all at once
+        statuses = await self._verify_many(session, [jobs[i] for i in verify_indices])
+        open_mask = fresh_mask.copy()
+        open_mask[verify_indices] = statuses
+        for i in np.flatnonzero(relevant_mask).tolist():
+            jobs[i].is_currently_open = bool(open_mask[i])
         
-        return filtered_jobs
+        # Select the top results by relevance score (highest first)
+        kept_indices = np.flatnonzero(relevant_mask & open_mask)
+        return [jobs[kept_indices[i]] for i in _top_k_indices(scores[kept_indices], max_results)]
     
-    def _calculate_relevance_score(self, job: JobListing, location: str, keywords: List[str]) -> float:
-        """Calculate how relevant a job is to the search criteria"""
-        score = 0.0
+    def _days_since_posted(self, jobs: List[JobListing]) -> np.ndarray:
+        """Age of each job in days as timedelta64[D], NaT where the posted date is unknown"""
+        posted_dates = np.array([job.posted_date or "NaT" for job in jobs], dtype=str)
+        
+        # Measured against a single "today" for the whole pass
+        today = np.datetime64("today", "D")
+        return today - self._parse_posted_dates(posted_dates)
+    
+    def _calculate_relevance_scores(self, jobs: List[JobListing], location: str, keywords: List[str], days_old: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Calculate how relevant each job is to the search criteria
+        
+        Args:
+            jobs: Job listings to score
+            location: Search location
+            keywords: Search keywords
+            days_old: Precomputed result of _days_since_posted, if available
+            
+        Returns:
+            Array of relevance scores in [0, 1], one per job
+        """
+        if not jobs:
+            return np.zeros(0)
+        
+        # Stage the fields as columns so each scoring term is a single array operation
+        texts = [f"{job.title} {job.description}" for job in jobs]
+        locations = np.char.lower(np.array([job.location for job in jobs]))
+        if days_old is None:
+            days_old = self._days_since_posted(jobs)
         
         # Location relevance (30% of score)
-        if location.lower() in job.location.lower():
-            score += 0.3
-        elif any(word in job.location.lower() for word in location.lower().split()):
-            score += 0.2
+        loc_lower = location.lower()
+        loc_tokens = set(loc_lower.split())
+        exact_location = np.char.find(locations, loc_lower) >= 0
+        partial_location = np.fromiter(
+            (bool(loc_tokens & set(job_location.split())) for job_location in locations.tolist()),
+            dtype=bool, count=len(jobs)
+        )
+        location_scores = np.where(exact_location, 0.3, np.where(partial_location, 0.2, 0.0))
         
         # Keyword relevance (50% of score)
-        job_text = f"{job.title} {job.description}".lower()
-        keyword_matches = sum(1 for keyword in keywords if keyword.lower() in job_text)
-        score += (keyword_matches / len(keywords)) * 0.5
+        keyword_scores = self._keyword_similarities(texts, keywords) * 0.5
         
         # Recency relevance (20% of score)
-        if job.posted_date:
-            try:
-                posted_date = datetime.strptime(job.posted_date, "%Y-%m-%d")
-                days_old = (datetime.now() - posted_date).days
-                if days_old <= 7:
-                    score += 0.2
-                elif days_old <= 30:
-                    score += 0.1
-            except:
-                pass
+        known = ~np.isnat(days_old)
+        days = days_old.astype(np.int64)
+        recency_scores = np.where(known & (days <= 7), 0.2, np.where(known & (days <= 30), 0.1, 0.0))
         
-        return min(score, 1.0)
+        return np.minimum(location_scores + keyword_scores + recency_scores, 1.0)
+    
+    def _parse_posted_dates(self, posted_dates: np.ndarray) -> np.ndarray:
+        """Convert posted date strings to datetime64[D], with NaT for unknown dates"""
+        try:
+            return posted_dates.astype("datetime64[D]")
+        except ValueError:
+            # At least one date isn't in numpy's ISO form, so parse them one by one;
+            # listings share a handful of dates, so the parser is memoized
+            return np.array([_parse_posted_date(posted_date) for posted_date in posted_dates.tolist()], dtype="datetime64[D]")
+    
+    def _keyword_similarities(self, texts: List[str], keywords: List[str]) -> np.ndarray:
+        """
+        Score how well each job text matches the keywords
+        
+        Returns:
+            Array of TF-IDF cosine similarities in [0, 1], one per text
+        """
+        # The query is the last document so it shares the corpus vocabulary
+        corpus = texts + [" ".join(keywords)]
+        
+        try:
+            matrix = TfidfVectorizer(stop_words="english", sublinear_tf=True).fit_transform(corpus)
+        except ValueError:
+            # Every term in the corpus was a stop word
+            matrix = None
+        
+        if matrix is None or matrix[-1].nnz == 0:
+            # None of the keywords survived tokenization (stop words, one-letter
+            # terms like "C"), so fall back to the fraction of keywords present,
+            # found with one compiled alternation pass over each text
+            kw_lowers = {keyword.lower() for keyword in keywords}
+            keyword_re = re.compile(
+                r"(?<!\w)(" + "|".join(re.escape(keyword) for keyword in kw_lowers) + r")(?!\w)",
+                re.IGNORECASE
+            )
+            return np.array([
+                len({match.lower() for match in keyword_re.findall(text)}) / len(kw_lowers)
+                for text in texts
+            ])
+        
+        # Rows are L2-normalized, so the dot product is the cosine similarity
+        return (matrix[:-1] @ matrix[-1].T).toarray().ravel()
     
     def _verify_job_status(self, job: JobListing) -> bool:
         """Verify if a job is currently open"""
+        return _run_sync(self._verify_one(job))
+    
+    async def _verify_one(self, job: JobListing) -> bool:
+        """Verify a single job with its own short-lived session"""
+        async with self._create_session() as session:
+            statuses = await self._verify_many(session, [job])
+        return statuses[0]
+    
+    async def _verify_many(self, session: aiohttp.ClientSession, jobs: List[JobListing]) -> List[bool]:
+        """Verify which jobs are currently open using concurrent HEAD requests"""
         # This is a basic implementation
         # In production, you'd check the actual job posting status
+        semaphore = asyncio.Semaphore(VERIFY_CONCURRENCY)
         
-        # Check if the job URL is accessible
-        try:
-            response = self.session.head(job.url, timeout=5)
-            return response.status_code == 200
-        except:
-            # If we can't verify, assume it's open
-            return True
+        async def check(url: str) -> bool:
+            host = urlparse(url).netloc
+            if host in _dead_hosts:
+                # Host is unreachable, so we can't verify; assume it's open
+                return True
+            
+            # Check if the job URL is accessible
+            try:
+                async with semaphore:
+                    async with session.head(url, allow_redirects=False, timeout=VERIFY_REQUEST_TIMEOUT) as response:
+                        is_open = response.status == 200
+            except aiohttp.ClientConnectorError:
+                _dead_hosts[host] = True
+                return True
+            except Exception:
+                # If we can't verify, assume it's open
+                return True
+            
+            _url_status_cache[url] = is_open
+            return is_open
+        
+        # Only hit the network once per distinct URL we haven't seen before
+        statuses = {}
+        pending = []
+        for url in dict.fromkeys(job.url for job in jobs):
+            if url in _url_status_cache:
+                statuses[url] = _url_status_cache[url]
+            else:
+                pending.append(url)
+        
+        results = await asyncio.gather(*(check(url) for url in pending))
+        statuses.update(zip(pending, results))
+        
+        return [statuses[job.url] for job in jobs]
 
 def main():
     """Main application entry point"""
@@ -405,26 +790,12 @@ def main():
             "keywords": keywords,
             "timestamp": timestamp
         },
-        "jobs": [
-            {
-                "title": job.title,
-                "company": job.company,
-                "location": job.location,
-                "description": job.description,
-                "url": job.url,
-                "source": job.source,
-                "posted_date": job.posted_date,
-                "salary": job.salary,
-                "job_type": job.job_type,
-                "relevance_score": job.relevance_score,
-                "is_currently_open": job.is_currently_open
-            }
-            for job in jobs
-        ]
+        # orjson serializes the JobListing dataclasses natively
+        "jobs": jobs
     }
     
-    with open(filename, 'w') as f:
-        json.dump(results_data, f, indent=2)
+    with open(filename, 'wb') as f:
+        f.write(orjson.dumps(results_data, option=orjson.OPT_INDENT_2))
     
     print(f"\n💾 Results saved to: {filename}")
 
@@ -10,13 +10,13 @@ echo ""
 # Check if Python is available
 if ! command -v python3 &> /dev/null; then
     echo "❌ Python 3 is not installed or not in PATH"
-    echo "Please install Python 3.8+ and try again"
+    echo "Please install Python 3.10+ and try again"
     exit 1
 fi
 
 # Check if requirements are installed
 echo "📦 Checking dependencies..."
-if ! python3 -c "import requests, dotenv" 2>/dev/null; then
+if ! python3 -c "import aiohttp, aiodns, dotenv" 2>/dev/null; then
     echo "⚠️ Some dependencies are missing. Installing..."
     pip3 install -r requirements.txt
     if [ $? -ne 0 ]; then
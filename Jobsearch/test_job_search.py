@@ -30,7 +30,7 @@ def test_job_search_engine():
         
         # Test relevance scoring
         test_job = test_jobs[0]
-        relevance = engine._calculate_relevance_score(test_job, "San Francisco", ["python", "developer"])
+        relevance = engine._calculate_relevance_scores([test_job], "San Francisco", ["python", "developer"])[0]
         print(f"✅ Relevance scoring works: {relevance:.2f}")
         
         # Test job status verification
@@ -20,25 +20,35 @@ programs talk to our application over the internet.
 from calendar import weekday
 import logging  # For recording what happens in our app
 import asyncio  # For handling multiple tasks at the same time
+import functools  # For caching function results
+import time  # For cheap Unix timestamps
 from contextlib import asynccontextmanager  # For managing app startup/shutdown
-from typing import Dict, Any  # For type hints (helps catch errors)
+from dataclasses import dataclass  # For creating simple data containers
+from typing import Dict, Any, List  # For type hints (helps catch errors)
 
 # Third-party imports - these are external packages we installed
+import httpx  # Async HTTP client with connection pooling
+import numpy as np  # Fast math on whole arrays of numbers
+import orjson  # Fast JSON serializer
+from cachetools import TTLCache  # Small cache whose entries expire on their own
 from fastapi import FastAPI, Request, HTTPException  # Web framework
 from fastapi.middleware.cors import CORSMiddleware  # Allows web browsers to access our API
+from fastapi.middleware.gzip import GZipMiddleware  # Compresses large responses
 from fastapi.middleware.trustedhost import TrustedHostMiddleware  # Security middleware
-from fastapi.responses import JSONResponse  # For sending JSON data back to clients
+from fastapi.responses import Response  # For sending raw bytes back to clients
 from fastapi.openapi.docs import get_swagger_ui_html  # For API documentation
 from fastapi.openapi.utils import get_openapi  # For API schema generation
 
 # Our custom imports - these are files we created in this project
-from .routes import webhooks_router, api_router, health_router  # URL routing
+from .responses import ORJSONResponse  # Fast JSON responses
+from .routes import ALL_ROUTERS  # URL routing
 from .services.scheduler_service import SchedulerService  # Background task scheduler
 from .services.stock_service import StockService  # Stock data fetching
 from .services.sms_service import SMSService  # SMS messaging (legacy)
 from .services.email_service import EmailService  # Email messaging
 from .services.agent_service import AgentService  # AI analysis
 from .services.alert_preferences_service import AlertPreferencesService  # Alert preferences management
+from .services.stock_list_service import StockListService  # Tracked stock list management
 from .models.config import settings  # App configuration
 
 # Configure logging - this sets up how we record what happens in our app
@@ -49,14 +59,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)  # Create a logger for this specific file
 
-# Global service instances - these will hold our main services
-# Think of these as the "workers" that do the actual work
-scheduler_service = None  # Handles scheduled tasks (like checking stock prices every hour)
-stock_service = None      # Fetches stock data from the internet
-sms_service = None        # Sends and receives SMS messages (legacy)
-email_service = None      # Sends email alerts
-agent_service = None      # Uses AI to analyze stock movements
-alert_preferences_service = None  # Manages alert preferences and settings
+# How many stocks we check at the same time during a scheduled price check
+SYMBOL_CHECK_CONCURRENCY = 10
+
+# Alert emails are queued and sent by background workers so a slow mail
+# server never holds up the price check
+EMAIL_QUEUE_SIZE = 1000
+EMAIL_WORKER_COUNT = 2
+EMAIL_FLUSH_TIMEOUT = 30  # Seconds to wait for queued emails on shutdown
+
+# How long the price check remembers whether alerts are switched on at all
+ALERTS_ENABLED_TTL = 30  # Seconds
+
+
+@dataclass(slots=True)
+class _MinimalAnalysis:
+    """Stand-in for AI analysis when it is turned off in the alert preferences."""
+    analysis: str
+    key_factors: List[str]
 
 
 @asynccontextmanager
@@ -73,9 +93,11 @@ async def lifespan(app: FastAPI):
     
     The @asynccontextmanager decorator tells FastAPI to call this function
     when the app starts and stops.
+    
+    Our services live on app.state (rather than in global variables) so the
+    scheduled tasks can be handed the app and find everything they need there.
     """
-    # Make these variables available throughout the function
-    global scheduler_service, stock_service, sms_service, email_service, agent_service, alert_preferences_service
+    state = app.state
     
     # ===== STARTUP PHASE =====
     logger.info("Starting AI Stock Tracking Agent...")
@@ -83,29 +105,58 @@ async def lifespan(app: FastAPI):
     try:
         # Initialize all our services - this is like hiring all the workers
         logger.info("Creating service instances...")
-        stock_service = StockService()      # Worker that gets stock prices
-        sms_service = SMSService()          # Worker that sends SMS messages (legacy)
-        email_service = EmailService()      # Worker that sends email alerts
-        agent_service = AgentService()      # Worker that does AI analysis
-        alert_preferences_service = AlertPreferencesService()  # Worker that manages alert preferences
-        scheduler_service = SchedulerService()  # Worker that schedules tasks
-        
-        # Tell the scheduler what tasks to run and when
-        # This is like setting up a schedule for our workers
-        logger.info("Registering scheduled tasks...")
-        scheduler_service.register_task_callback('stock_check', stock_price_check_task)
-        scheduler_service.register_task_callback('cache_cleanup', cache_cleanup_task)
-        scheduler_service.register_task_callback('health_check', health_check_task)
-        
-        # Start the scheduler - this begins running our scheduled tasks
-        logger.info("Starting background scheduler...")
-        await scheduler_service.start()
+        # One shared HTTP connection pool for outgoing API calls, so repeated
+        # requests reuse open connections instead of reconnecting every time
+        state.http = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        )
+        
+        state.stock_service = StockService()      # Worker that gets stock prices
+        state.sms_service = SMSService()          # Worker that sends SMS messages (legacy)
+        state.email_service = EmailService(http_client=state.http)  # Worker that sends email alerts
+        state.agent_service = AgentService()      # Worker that does AI analysis
+        state.alert_preferences_service = AlertPreferencesService()  # Worker that manages alert preferences
+        state.stock_list_service = StockListService()  # Worker that keeps the list of tracked stocks
+        state.scheduler_service = SchedulerService()  # Worker that schedules tasks
+        
+        # Start the background email senders - price checks drop alerts on this
+        # queue and move on instead of waiting for each email to go out
+        logger.info("Starting email workers...")
+        state.email_queue = asyncio.Queue(maxsize=EMAIL_QUEUE_SIZE)
+        state.email_workers = [
+            asyncio.create_task(_email_worker(state.email_queue, state.email_service))
+            for _ in range(EMAIL_WORKER_COUNT)
+        ]
+        
+        # Held while a stock price check runs so overlapping checks get skipped
+        state.stock_check_lock = asyncio.Lock()
+        # Remembers for a short while whether alerts are switched on at all, so a
+        # disabled setup skips each price check without touching any files
+        state.alerts_enabled_cache = TTLCache(maxsize=1, ttl=ALERTS_ENABLED_TTL)
+        
+        # Only one process should run the scheduler, otherwise every web
+        # process would check prices (and send alerts) on its own
+        if settings.enable_scheduler:
+            # Tell the scheduler what tasks to run and when
+            # This is like setting up a schedule for our workers. Each task
+            # gets the app bound in so it can reach the services on app.state.
+            logger.info("Registering scheduled tasks...")
+            state.scheduler_service.register_task_callback('stock_check', functools.partial(stock_price_check_task, app=app))
+            state.scheduler_service.register_task_callback('cache_cleanup', functools.partial(cache_cleanup_task, app=app))
+            state.scheduler_service.register_task_callback('health_check', functools.partial(health_check_task, app=app))
+            
+            # Start the scheduler - this begins running our scheduled tasks
+            logger.info("Starting background scheduler...")
+            await state.scheduler_service.start()
+        else:
+            logger.info("Scheduler disabled for this process (ENABLE_SCHEDULER=false)")
         
         logger.info("All services initialized successfully")
         
     except Exception as e:
         # If anything goes wrong during startup, log the error and stop
-        logger.error(f"Failed to initialize services: {str(e)}")
+        logger.error("Failed to initialize services: %s", e)
         raise  # This stops the app from starting
     
     # The 'yield' keyword is where the app actually runs
@@ -117,20 +168,35 @@ async def lifespan(app: FastAPI):
     
     try:
         # Stop the scheduler first - this stops all background tasks
-        if scheduler_service:
+        if getattr(state, "scheduler_service", None) and settings.enable_scheduler:
             logger.info("Stopping background scheduler...")
-            await scheduler_service.stop()
+            await state.scheduler_service.stop()
+        
+        # Let queued alert emails finish sending, then stop the email workers
+        if getattr(state, "email_queue", None) is not None:
+            logger.info("Flushing queued alert emails...")
+            try:
+                await asyncio.wait_for(state.email_queue.join(), timeout=EMAIL_FLUSH_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning("Gave up waiting on %d queued alert emails", state.email_queue.qsize())
+            for worker in state.email_workers:
+                worker.cancel()
+            await asyncio.gather(*state.email_workers, return_exceptions=True)
+        
+        # Close the shared HTTP connection pool once nothing is using it
+        if getattr(state, "http", None) is not None:
+            await state.http.aclose()
         
         # Clean up any cached data
-        if stock_service:
+        if getattr(state, "stock_service", None):
             logger.info("Clearing cached data...")
-            stock_service.clear_cache()
+            state.stock_service.clear_cache()
         
         logger.info("Shutdown completed successfully")
         
     except Exception as e:
         # Log any errors during shutdown, but don't crash
-        logger.error(f"Error during shutdown: {str(e)}")
+        logger.error("Error during shutdown: %s", e)
 
 
 # Create FastAPI application
@@ -163,6 +229,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,  # Render JSON responses with orjson
     lifespan=lifespan
 )
 
@@ -180,17 +247,22 @@ app.add_middleware(
     allowed_hosts=["*"]  # Configure appropriately for production
 )
 
+# Compress JSON and HTML bodies over 1 KB for clients that accept gzip.
+# List payloads (alert history, tracked stocks) repeat the same keys and
+# shrink a lot; small responses go out as-is since gzip wouldn't pay off.
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 
 # Custom exception handlers
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTP exceptions with custom error responses."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.detail,
             "status_code": exc.status_code,
-            "timestamp": "2024-01-01T00:00:00Z"
+            "timestamp": int(time.time())  # Unix seconds - cheaper than formatting an ISO string
         }
     )
 
@@ -198,37 +270,39 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions with custom error responses."""
-    logger.error(f"Unhandled exception: {str(exc)}")
-    return JSONResponse(
+    logger.error("Unhandled exception: %s", exc)
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
             "status_code": 500,
-            "timestamp": "2024-01-01T00:00:00Z"
+            "timestamp": int(time.time())
         }
     )
 
 
-# Include routers
-app.include_router(webhooks_router)
-app.include_router(api_router)
-app.include_router(health_router)
-
-# Import and include alert history router
-from .routes.alert_history import router as alert_history_router
-app.include_router(alert_history_router)
+# Include routers - the routes package lists them all in registration order
+for router in ALL_ROUTERS:
+    app.include_router(router)
 
-# Import and include dashboard router
-from .routes.dashboard import router as dashboard_router
-app.include_router(dashboard_router)
 
-# Import and include stock list router
-from .routes.stock_list import router as stock_list_router
-app.include_router(stock_list_router)
+# These payloads never change, so we serialize them once at startup instead of
+# building and encoding a new dict every time a health checker hits us
+_HEALTH_BYTES = orjson.dumps({
+    "status": "healthy",
+    "service": "AI Stock Tracking Agent",
+    "version": "1.0.0"
+})
 
-# Import and include alert preferences router
-from .routes.alert_preferences import router as alert_preferences_router
-app.include_router(alert_preferences_router)
+_ROOT_BYTES = orjson.dumps({
+    "message": "AI Stock Tracking Agent API",
+    "version": "1.0.0",
+    "status": "operational",
+    "docs": "/docs",
+    "health": "/health",
+    "api": "/api/v1",
+    "webhooks": "/webhooks"
+})
 
 
 # Simple health check endpoint for Railway
@@ -240,16 +314,7 @@ async def simple_health():
     Returns:
         Basic health status with HTTP 200
     """
-    from fastapi.responses import JSONResponse
-    return JSONResponse(
-        status_code=200,
-        content={
-            "status": "healthy",
-            "service": "AI Stock Tracking Agent",
-            "version": "1.0.0",
-            "timestamp": "2024-01-01T00:00:00Z"
-        }
-    )
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 # Root endpoint
@@ -261,23 +326,13 @@ async def root():
     Returns:
         Basic API information and links
     """
-    return {
-        "message": "AI Stock Tracking Agent API",
-        "version": "1.0.0",
-        "status": "operational",
-        "docs": "/docs",
-        "health": "/health",
-        "api": "/api/v1",
-        "webhooks": "/webhooks"
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 # Custom OpenAPI schema
+@functools.cache
 def custom_openapi():
-    """Generate custom OpenAPI schema with additional metadata."""
-    if app.openapi_schema:
-        return app.openapi_schema
-    
+    """Generate custom OpenAPI schema with additional metadata (built once, then cached)."""
     openapi_schema = get_openapi(
         title="AI Stock Tracking Agent API",
         version="1.0.0",
@@ -304,44 +359,165 @@ def custom_openapi():
         }
     ]
     
-    app.openapi_schema = openapi_schema
-    return app.openapi_schema
+    return openapi_schema
 
 
 app.openapi = custom_openapi
 
 
 # Scheduler task functions
-async def stock_price_check_task():
+async def _check_one_symbol(
+    symbol: str,
+    quote,
+    preferences,
+    price_change_percent: float,
+    threshold: float,
+    *,
+    semaphore: asyncio.Semaphore,
+    email_queue: asyncio.Queue,
+    agent_service,
+) -> None:
+    """
+    Send an alert for a single stock that moved past its threshold.
+    
+    stock_price_check_task has already compared every price against its
+    threshold in one go; this handles the slow part (AI analysis and email)
+    for the stocks that tripped it, and runs concurrently with the others.
+    
+    Args:
+        symbol: Stock symbol that triggered (e.g., "AAPL")
+        quote: Quote fetched for this symbol
+        preferences: Current alert preferences
+        price_change_percent: Percent move from the previous close
+        threshold: Alert threshold that was crossed
+        semaphore: Limits how many symbols are handled at once
+        email_queue: Queue the alert email is handed to for sending
+        agent_service: Service used for AI analysis
+    """
+    async with semaphore:
+        current_price = float(quote.price)
+        previous_close = float(quote.previous_close)  # Yesterday's closing price
+        
+        logger.info("Alert triggered for %s: %+.2f%% (threshold: %s%%)", symbol, price_change_percent, threshold)
+        
+        # Generate AI analysis (if enabled in preferences)
+        analysis = None
+        if preferences.include_analysis:
+            analysis = await agent_service.analyze_stock_movement(
+                symbol, float(quote.previous_close), float(quote.price), 
+                int(quote.volume) if hasattr(quote, 'volume') else 0
+            )
+        else:
+            # Create minimal analysis if disabled
+            analysis = _MinimalAnalysis(
+                analysis=f"Stock {symbol} moved {quote.change_percent:+.2f}%",
+                key_factors=["Price movement"]
+            )
+        
+        # Queue the email alert - a background worker sends it
+        try:
+            email_queue.put_nowait({
+                "symbol": symbol,
+                "current_price": current_price,
+                "previous_price": previous_close,
+                "change_percent": price_change_percent,
+                "analysis": analysis.analysis,
+                "key_factors": analysis.key_factors if preferences.include_key_factors else [],
+                "threshold_used": threshold
+            })
+        except asyncio.QueueFull:
+            logger.error("Email queue is full, dropping alert for %s", symbol)
+        
+        # Note: No need to store the alert in a database
+        # The web interface will fetch current prices on-demand
+
+
+async def _email_worker(queue: asyncio.Queue, email_service: EmailService) -> None:
+    """
+    Background worker that sends alert emails from the queue.
+    
+    Runs for the lifetime of the app. Several of these run side by side so
+    one slow email doesn't hold up the rest.
+    
+    Args:
+        queue: Queue of keyword arguments for email_service.send_stock_alert
+        email_service: Service used to send the emails
+    """
+    while True:
+        alert = await queue.get()
+        try:
+            await email_service.send_stock_alert(**alert)
+        except Exception as e:
+            logger.error("Error sending alert email for %s: %s", alert.get('symbol'), e)
+        finally:
+            queue.task_done()
+
+
+async def stock_price_check_task(app: FastAPI):
     """
     Scheduled task for checking stock prices and triggering alerts.
     
     This function is called by the scheduler at regular intervals
     to check stock prices and send alerts when thresholds are exceeded.
+    If the previous check is still running (e.g., the market API is slow),
+    this one is skipped instead of piling up on top of it.
+    
+    Args:
+        app: The running app, whose state holds the services to use
+    """
+    lock = app.state.stock_check_lock
+    if lock.locked():
+        logger.warning("Previous stock price check still running, skipping this one")
+        return
+    
+    async with lock:
+        await _run_stock_price_check(app.state)
+
+
+def _alerts_enabled_cached(preferences_service: AlertPreferencesService, cache: TTLCache) -> bool:
     """
+    Check whether alerts are turned on, re-reading preferences at most every ALERTS_ENABLED_TTL seconds.
+    
+    Args:
+        preferences_service: Service holding the alert preferences
+        cache: The app's alerts-enabled cache (cleared whenever preferences are saved)
+        
+    Returns:
+        True if alerts are active and email alerts are enabled
+    """
+    enabled = cache.get("enabled")
+    if enabled is None:
+        preferences_service.reload_if_changed()
+        preferences = preferences_service.preferences
+        enabled = bool(preferences and preferences.is_active and preferences.email_alerts_enabled)
+        cache["enabled"] = enabled
+    return enabled
+
+
+async def _run_stock_price_check(state):
+    """Check every tracked stock once and queue alerts for the big movers."""
     try:
         logger.info("Executing scheduled stock price check")
         
-        # STEP 1: Import all the services we need
-        # We import inside the function to prevent issues when the app starts up
-        from .services.stock_list_service import StockListService
-        from .services.alert_preferences_service import AlertPreferencesService
-        from .services.stock_service import StockService
-        from .services.email_service import EmailService
-        from .services.agent_service import AgentService
-        
-        # STEP 2: Create instances of all our services
+        # STEP 1: Use the services created once at startup in lifespan()
         # Each service handles a specific part of the system:
         # - stock_list_service: Manages the list of tracked stocks (stored in JSON file)
         # - preferences_service: Handles alert settings and thresholds for each stock
         # - stock_service: Fetches real-time stock data from Yahoo Finance API
         # - email_service: Sends email alerts to users when stocks hit thresholds
         # - agent_service: Uses AI to analyze stock movements and provide insights
-        stock_list_service = StockListService()
-        preferences_service = AlertPreferencesService()
-        stock_service = StockService()
-        email_service = EmailService()
-        agent_service = AgentService()
+        stock_list_service = state.stock_list_service
+        preferences_service = state.alert_preferences_service
+        
+        # If alerts are switched off there's nothing to do, so stop before any file or network work
+        if not _alerts_enabled_cached(preferences_service, state.alerts_enabled_cache):
+            logger.info("Alerts are disabled, skipping price check")
+            return
+        
+        # STEP 2: Pick up any changes made through the API since the last check
+        # This only re-reads the JSON files when they've actually been modified
+        stock_list_service.reload_if_changed()
+        preferences_service.reload_if_changed()
         
         # STEP 3: Get the list of all stocks we're currently tracking
         # This comes from our JSON database file where users add/remove stocks
@@ -352,6 +528,14 @@ async def stock_price_check_task():
             logger.warning("No active stocks found in tracking list")
             return
         
+        # Cap how many stocks we check so a huge watchlist can't flood the quote provider
+        if len(tracked_stocks) > settings.max_tracked_symbols:
+            logger.warning(
+                "Tracking %d stocks, only checking the first %d (MAX_TRACKED_SYMBOLS)",
+                len(tracked_stocks), settings.max_tracked_symbols
+            )
+            tracked_stocks = tracked_stocks[:settings.max_tracked_symbols]
+        
         # STEP 4: Check if email alerts are enabled
         # Users can disable alerts if they don't want to receive emails
         preferences = preferences_service.get_preferences()
@@ -359,119 +543,138 @@ async def stock_price_check_task():
             logger.warning("Email alerts not enabled, skipping price checks")
             return
         
-        # STEP 5: Process each tracked stock one by one
-        # This is the main loop that does all the work
+        # STEP 5: Fetch quotes for every tracked stock in one batched request
+        # This gets us the current price, previous close, volume, etc. Any
+        # symbol the batch misses is looked up individually by the service.
+        quotes = await state.stock_service.get_stock_quotes(tracked_stocks)
+        
+        # STEP 6: Skip any stock we couldn't get price data for
+        priced_symbols = []
         for symbol in tracked_stocks:
-            try:
-                # STEP 6: Fetch current stock data from Yahoo Finance
-                # This gets us the current price, previous close, volume, etc.
-                quote = await stock_service.get_stock_quote(symbol)
-                if not quote:
-                    logger.warning(f"No quote data available for {symbol}")
-                    continue  # Skip this stock if we can't get data
-                
-                # STEP 7: Extract the current price from the quote data
-                # We convert to float to make sure it's a number, not a string
-                current_price = float(quote.price)
-                
-                # STEP 8: Get the alert threshold for this specific stock
-                # Each stock can have its own threshold (e.g., AAPL at 1%, TSLA at 2%)
-                threshold = preferences_service.get_effective_threshold(symbol)
-                previous_close = float(quote.previous_close)  # Yesterday's closing price
-                
-                # STEP 9: Calculate how much the price has changed
-                # We use absolute value so both up and down movements trigger alerts
-                price_change_percent = ((current_price - previous_close) / previous_close * 100)
-                
-                if abs(price_change_percent) >= threshold:
-                    # Check if alert should be sent based on preferences
-                    if not preferences_service.should_send_alert(symbol):
-                        logger.info(f"Alert triggered for {symbol}: {price_change_percent:+.2f}% but alerts disabled")
-                        continue
-                    
-                    logger.info(f"Alert triggered for {symbol}: {price_change_percent:+.2f}% (threshold: {threshold}%)")
-                    
-                    # Generate AI analysis (if enabled in preferences)
-                    analysis = None
-                    if preferences.include_analysis:
-                        analysis = await agent_service.analyze_stock_movement(
-                            symbol, float(quote.previous_close), float(quote.price), 
-                            int(quote.volume) if hasattr(quote, 'volume') else 0
-                        )
-                    else:
-                        # Create minimal analysis if disabled
-                        analysis = type('Analysis', (), {
-                            'analysis': f"Stock {symbol} moved {quote.change_percent:+.2f}%",
-                            'key_factors': ["Price movement"]
-                        })()
-                    
-                    # Send email alert
-                    await email_service.send_stock_alert(
-                        symbol=symbol,
-                        current_price=current_price,
-                        previous_price=previous_close,
-                        change_percent=price_change_percent,
-                        analysis=analysis.analysis,
-                        key_factors=analysis.key_factors if preferences.include_key_factors else [],
-                        threshold_used=threshold
-                    )
-                    
-                    # Note: Alert sent successfully - no need to store in database
-                    # The web interface will fetch current prices on-demand
-                    
-            except Exception as e:
-                logger.error(f"Error processing stock {symbol}: {str(e)}")
+            if quotes.get(symbol):
+                priced_symbols.append(symbol)
+            else:
+                logger.warning("No quote data available for %s", symbol)
+        
+        if not priced_symbols:
+            logger.info("Stock price check completed")
+            return
+        
+        # STEP 7: Compare every price against its threshold in one shot
+        # Each stock can have its own threshold (e.g., AAPL at 1%, TSLA at 2%).
+        # NumPy does the math for all stocks at once instead of one at a time,
+        # and we use absolute value so both up and down movements trigger alerts.
+        thresholds = preferences_service.get_effective_thresholds(
+            priced_symbols, stock_list_service.tracked_stocks
+        )
+        current = np.array([float(quotes[s].price) for s in priced_symbols], dtype=np.float64)
+        previous = np.array([float(quotes[s].previous_close) for s in priced_symbols], dtype=np.float64)
+        threshold_array = np.array([thresholds[s] for s in priced_symbols], dtype=np.float64)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            change_percent = (current - previous) / previous * 100.0
+        # A missing/zero previous close can't tell us anything, so never alert on it
+        triggered_mask = (previous > 0) & (np.abs(change_percent) >= threshold_array)
+        
+        # STEP 8: Check once which stocks we're allowed to alert on
+        # The preferences are read a single time here instead of per stock
+        enabled = preferences_service.get_enabled_symbols(priced_symbols)
+        triggered = []
+        for i in np.flatnonzero(triggered_mask):
+            symbol = priced_symbols[i]
+            if symbol not in enabled:
+                logger.info("Alert triggered for %s: %+.2f%% but alerts disabled", symbol, change_percent[i])
+                continue
+            triggered.append(i)
+        
+        # STEP 9: Handle the stocks that moved enough, all at the same time
+        # The semaphore caps how many run at once so we don't hammer the
+        # AI and email providers.
+        semaphore = asyncio.Semaphore(SYMBOL_CHECK_CONCURRENCY)
+        alert_symbols = [priced_symbols[i] for i in triggered]
+        tasks = [
+            _check_one_symbol(
+                priced_symbols[i],
+                quotes[priced_symbols[i]],
+                preferences,
+                float(change_percent[i]),
+                float(threshold_array[i]),
+                semaphore=semaphore,
+                email_queue=state.email_queue,
+                agent_service=state.agent_service,
+            )
+            for i in triggered
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        # One bad symbol shouldn't abort the whole batch - just log it
+        for symbol, result in zip(alert_symbols, results):
+            if isinstance(result, Exception):
+                logger.error("Error processing stock %s: %s", symbol, result)
         
         logger.info("Stock price check completed")
         
     except Exception as e:
-        logger.error(f"Error in stock price check task: {str(e)}")
+        logger.error("Error in stock price check task: %s", e)
 
 
-async def cache_cleanup_task():
+async def cache_cleanup_task(app: FastAPI):
     """
     Scheduled task for cleaning up cached data.
     
     This function is called daily to clean up old cached data
     and temporary files.
+    
+    Args:
+        app: The running app, whose state holds the services to use
     """
     try:
         logger.info("Executing cache cleanup task")
         
-        if stock_service:
-            stock_service.clear_cache()
+        app.state.stock_service.clear_cache()
         
         logger.info("Cache cleanup completed")
         
     except Exception as e:
-        logger.error(f"Error in cache cleanup task: {str(e)}")
+        logger.error("Error in cache cleanup task: %s", e)
 
 
-async def health_check_task():
+async def health_check_task(app: FastAPI):
     """
     Scheduled task for system health monitoring.
     
     This function is called periodically to check system health
     and log status information.
+    
+    Args:
+        app: The running app, whose state holds the services to use
     """
+    state = app.state
     try:
         logger.info("Executing health check task")
         
-        # Check service status
-        services_status = {
-            "stock_service": stock_service.get_cache_stats() if stock_service else "unavailable",
-            "sms_service": sms_service.get_service_status() if sms_service else "unavailable",
-            "agent_service": agent_service.get_service_status() if agent_service else "unavailable",
-            "scheduler_service": scheduler_service.get_scheduler_status() if scheduler_service else "unavailable"
-        }
-        
-        logger.info(f"System health check completed: {services_status}")
+        # Collecting every service's status is only worth doing if someone
+        # is actually reading debug logs - otherwise just note that we're alive
+        if logger.isEnabledFor(logging.DEBUG):
+            services_status = {
+                "stock_service": state.stock_service.get_cache_stats(),
+                "sms_service": state.sms_service.get_service_status() if state.sms_service else "unavailable",
+                "agent_service": state.agent_service.get_service_status(),
+                "scheduler_service": state.scheduler_service.get_scheduler_status()
+            }
+            logger.debug("System health check completed: %s", services_status)
+        else:
+            logger.info("System health check completed")
         
     except Exception as e:
-        logger.error(f"Error in health check task: {str(e)}")
+        logger.error("Error in health check task: %s", e)
 
 
 # Development server runner
+# For production, run uvicorn directly, e.g.:
+#   uvicorn app.main:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools
+# Each --workers process runs its own lifespan (and scheduler), so when running
+# more than one, set ENABLE_SCHEDULER=false on all but one of them.
 if __name__ == "__main__":
     import uvicorn
     
@@ -481,5 +684,7 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
+        loop="uvloop",  # Faster event loop (installed with uvicorn[standard])
+        http="httptools",  # Faster HTTP parser (installed with uvicorn[standard])
         log_level=settings.log_level.lower()
     )
@@ -5,13 +5,14 @@ This package contains all Pydantic models for configuration,
 data structures, and API request/response schemas.
 """
 
-from .config import Settings
+from .config import Settings, get_settings
 from .stock import Stock, StockAlert, StockPrice
 from .user import User, UserPreferences
 from .sms import SMSMessage, TwilioWebhook
 
 __all__ = [
     "Settings",
+    "get_settings",
     "Stock", 
     "StockAlert",
     "StockPrice",
@@ -7,8 +7,9 @@ the analysis that was generated.
 """
 
 from datetime import datetime
-from typing import Optional, List, Union
-from pydantic import BaseModel, Field, validator
+from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, Field, field_validator
+from pydantic.dataclasses import dataclass
 
 
 class AlertHistory(BaseModel):
@@ -34,9 +35,10 @@ class AlertHistory(BaseModel):
     key_factors: List[str] = Field(default_factory=list, description="Key factors that influenced the price change")
     
     # Timestamp information
-    timestamp: Union[datetime, str] = Field(default_factory=datetime.utcnow, description="When the alert was sent")
+    timestamp: datetime = Field(default_factory=datetime.utcnow, description="When the alert was sent")
     
-    @validator('timestamp', pre=True)
+    @field_validator('timestamp', mode='before')
+    @classmethod
     def parse_timestamp(cls, v):
         """Parse timestamp from string or datetime."""
         if isinstance(v, str):
@@ -49,12 +51,6 @@ class AlertHistory(BaseModel):
     # Additional metadata
     threshold_used: float = Field(..., description="Alert threshold that was used (e.g., 3.0 for 3%)")
     email_sent: bool = Field(default=True, description="Whether email was successfully sent")
-    
-    class Config:
-        """Pydantic configuration for the model."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 class AlertHistoryResponse(BaseModel):
@@ -74,11 +70,12 @@ class AlertHistoryResponse(BaseModel):
     alert_type: str
     analysis: str
     key_factors: List[str]
-    timestamp: Union[datetime, str]
+    timestamp: datetime
     threshold_used: float
     email_sent: bool
     
-    @validator('timestamp', pre=True)
+    @field_validator('timestamp', mode='before')
+    @classmethod
     def parse_timestamp(cls, v):
         """Parse timestamp from string or datetime."""
         if isinstance(v, str):
@@ -92,19 +89,31 @@ class AlertHistoryResponse(BaseModel):
     price_change_dollar: float = Field(..., description="Dollar amount change (computed)")
     time_ago: str = Field(..., description="Human-readable time ago (e.g., '2 hours ago')")
     
-    class Config:
-        """Pydantic configuration for the response model."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "AlertHistoryResponse":
+        """
+        Build a response from a stored alert without validating it again.
+        
+        Alerts are validated as AlertHistory when the history file is loaded,
+        so the service can skip a second validation pass for each response.
+        
+        Args:
+            row: Dictionary of field values
+            
+        Returns:
+            AlertHistoryResponse built with model_construct
+        """
+        return cls.model_construct(**row)
 
 
-class AlertHistorySummary(BaseModel):
+@dataclass(slots=True)
+class AlertHistorySummary:
     """
     Summary model for alert history statistics.
     
     This provides a quick overview of alert activity,
-    useful for dashboard displays.
+    useful for dashboard displays. It has no validators, so it is a slotted
+    Pydantic dataclass rather than a full model to keep instances small.
     """
     
     total_alerts: int = Field(..., description="Total number of alerts sent")
@@ -112,9 +121,3 @@ class AlertHistorySummary(BaseModel):
     most_active_stock: str = Field(..., description="Stock with most alerts")
     last_alert_time: Optional[datetime] = Field(None, description="When the last alert was sent")
     average_change_percent: float = Field(..., description="Average percentage change across all alerts")
-    
-    class Config:
-        """Pydantic configuration for the summary model."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
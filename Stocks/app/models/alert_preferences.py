@@ -6,8 +6,29 @@ for alert thresholds, frequency, types, and other customization options.
 """
 
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Union
-from pydantic import BaseModel, Field, validator
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Literal
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+# Allowed alert frequency settings (checked by pydantic via the Literal type)
+AlertFrequency = Literal["MARKET_HOURS", "DAILY", "HOURLY", "CUSTOM"]
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """
+    Parse an ISO-8601 string, accepting a trailing 'Z' for UTC.
+    
+    The same few timestamps get parsed over and over (every time preferences
+    are loaded or returned), so results are cached.
+    
+    Raises:
+        ValueError: If the string isn't a valid ISO-8601 datetime
+    """
+    if value.endswith('Z'):
+        return datetime.fromisoformat(value[:-1] + '+00:00')
+    return datetime.fromisoformat(value)
 
 
 class AlertPreferences(BaseModel):
@@ -30,7 +51,7 @@ class AlertPreferences(BaseModel):
     )
     
     # Alert frequency settings
-    alert_frequency: str = Field(
+    alert_frequency: AlertFrequency = Field(
         default="MARKET_HOURS", 
         description="Alert frequency: MARKET_HOURS, DAILY, HOURLY, CUSTOM"
     )
@@ -95,88 +116,66 @@ class AlertPreferences(BaseModel):
     )
     
     # Metadata
-    created_date: Union[datetime, str] = Field(default_factory=datetime.utcnow, description="When preferences were created")
-    updated_date: Union[datetime, str] = Field(default_factory=datetime.utcnow, description="When preferences were last updated")
+    created_date: datetime = Field(default_factory=datetime.utcnow, description="When preferences were created")
+    updated_date: datetime = Field(default_factory=datetime.utcnow, description="When preferences were last updated")
     is_active: bool = Field(default=True, description="Whether these preferences are active")
     
-    @validator('created_date', 'updated_date', pre=True)
+    @field_validator('created_date', 'updated_date', mode='before')
+    @classmethod
     def parse_datetime_fields(cls, v):
         """Parse datetime fields from string or datetime."""
         if isinstance(v, str):
             try:
-                return datetime.fromisoformat(v.replace('Z', '+00:00'))
+                return _parse_iso(v)
             except ValueError:
                 return datetime.utcnow()
         return v
     
-    class Config:
-        """Pydantic configuration for the model."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "AlertPreferences":
+        """
+        Build preferences from trusted data without running validation.
+        
+        Use this for data our own code already validated; user input should
+        go through the normal constructor.
+        
+        Args:
+            row: Dictionary of field values
+            
+        Returns:
+            AlertPreferences built without running validators
+        """
+        return cls.model_construct(**row)
 
 
-class AlertPreferencesResponse(BaseModel):
+class AlertPreferencesResponse(AlertPreferences):
     """
     Response model for alert preferences API endpoints.
     
     This is used when returning alert preferences data to the user,
-    with additional computed fields for better user experience.
+    with additional computed fields for better user experience. It has
+    every AlertPreferences field (and its validators), plus the computed
+    fields below.
     """
     
-    # Basic preferences information
+    # Responses always describe saved preferences, so they always have an ID
     id: int
-    global_alert_threshold: float
-    alert_frequency: str
-    market_hours_only: bool
-    # Removed alert_types field as it's no longer in the model
-    email_alerts_enabled: bool
-    email_rich_format: bool
-    sms_alerts_enabled: bool
-    include_analysis: bool
-    include_key_factors: bool
-    include_price_history: bool
-    max_alerts_per_day: int
-    alert_cooldown_minutes: int
-    enable_volume_alerts: bool
-    volume_threshold_multiplier: float
-    enable_news_alerts: bool
-    news_sentiment_threshold: float
-    custom_schedule: Optional[Dict[str, Any]]
-    created_date: Union[datetime, str]
-    updated_date: Union[datetime, str]
-    is_active: bool
-    
-    @validator('created_date', 'updated_date', pre=True)
-    def parse_datetime_fields(cls, v):
-        """Parse datetime fields from string or datetime."""
-        if isinstance(v, str):
-            try:
-                return datetime.fromisoformat(v.replace('Z', '+00:00'))
-            except ValueError:
-                return datetime.utcnow()
-        return v
     
     # Computed fields for better user experience
-    next_alert_time: Optional[Union[datetime, str]] = Field(None, description="When the next alert is scheduled")
+    next_alert_time: Optional[datetime] = Field(None, description="When the next alert is scheduled")
     alerts_sent_today: int = Field(0, description="Number of alerts sent today")
     cooldown_active: bool = Field(False, description="Whether cooldown is currently active")
     
-    @validator('next_alert_time', pre=True)
+    @field_validator('next_alert_time', mode='before')
+    @classmethod
     def parse_next_alert_time(cls, v):
         """Parse next_alert_time from string or datetime."""
         if isinstance(v, str):
             try:
-                return datetime.fromisoformat(v.replace('Z', '+00:00'))
+                return _parse_iso(v)
             except ValueError:
                 return None
         return v
-    
-    class Config:
-        """Pydantic configuration for the response model."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
 
 
 class UpdateAlertPreferencesRequest(BaseModel):
@@ -187,7 +186,7 @@ class UpdateAlertPreferencesRequest(BaseModel):
     """
     
     global_alert_threshold: Optional[float] = Field(None, ge=0.1, le=50.0, description="Global alert threshold percentage")
-    alert_frequency: Optional[str] = Field(None, description="Alert frequency setting")
+    alert_frequency: Optional[AlertFrequency] = Field(None, description="Alert frequency setting")
     market_hours_only: Optional[bool] = Field(None, description="Market hours only setting")
     alert_types: Optional[List[str]] = Field(None, description="Alert types to send")
     email_alerts_enabled: Optional[bool] = Field(None, description="Enable email alerts")
@@ -205,9 +204,9 @@ class UpdateAlertPreferencesRequest(BaseModel):
     custom_schedule: Optional[Dict[str, Any]] = Field(None, description="Custom alert schedule")
     is_active: Optional[bool] = Field(None, description="Whether preferences are active")
     
-    class Config:
-        """Pydantic configuration for the request model."""
-        schema_extra = {
+    # Pydantic configuration for the request model
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "global_alert_threshold": 2.5,
                 "alert_frequency": "MARKET_HOURS",
@@ -218,6 +217,7 @@ class UpdateAlertPreferencesRequest(BaseModel):
                 "alert_cooldown_minutes": 45
             }
         }
+    )
 
 
 class AlertPreferencesSummary(BaseModel):
@@ -228,6 +228,9 @@ class AlertPreferencesSummary(BaseModel):
     useful for dashboard displays.
     """
     
+    # Summaries are built once and never changed
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     total_preferences: int = Field(..., description="Total number of preference sets")
     active_preferences: int = Field(..., description="Number of active preference sets")
     average_threshold: float = Field(..., description="Average alert threshold across all preferences")
@@ -235,9 +238,3 @@ class AlertPreferencesSummary(BaseModel):
     email_enabled_count: int = Field(..., description="Number of preferences with email enabled")
     sms_enabled_count: int = Field(..., description="Number of preferences with SMS enabled")
     last_updated: Optional[datetime] = Field(None, description="When preferences were last updated")
-    
-    class Config:
-        """Pydantic configuration for the summary model."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
@@ -18,6 +18,7 @@ app more flexible.
 
 # Standard library imports
 from typing import Optional  # For optional values (can be None)
+from functools import lru_cache  # For building the settings only once
 import os  # For operating system interactions
 
 # Third-party imports
@@ -100,6 +101,16 @@ class Settings(BaseSettings):
         env="MARKET_HOURS_SCHEDULE", 
         description="Use market hours schedule (9:35 AM, 10:30 AM, 12:00 PM, 2:00 PM, 3:55 PM EST)"
     )
+    max_tracked_symbols: int = Field(
+        default=500,  # Default: check at most 500 stocks per price check
+        env="MAX_TRACKED_SYMBOLS",
+        description="Most stocks checked in one price check - protects the quote provider from huge watchlists"
+    )
+    enable_scheduler: bool = Field(
+        default=True,  # Default: this process runs the scheduled price checks
+        env="ENABLE_SCHEDULER",
+        description="Run the background scheduler in this process - turn off on extra web processes so checks only run once"
+    )
     
     # ===== DATABASE SETTINGS SECTION =====
     # Where we store our data
@@ -184,15 +195,41 @@ class Settings(BaseSettings):
         
         This tells Pydantic how to behave when loading settings.
         """
-        env_file = ".env"  # Use relative path for better portability
+        env_file = os.getenv("ENV_FILE", ".env")  # Relative path by default; ENV_FILE points somewhere else
         env_file_encoding = "utf-8"  # How to read the file (UTF-8 supports all characters)
         case_sensitive = False  # Don't care about uppercase/lowercase in variable names
         extra = "ignore"  # If there are extra variables in .env, just ignore them
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings, loading them the first time only.
+    
+    Reading the .env file and environment variables happens once; every
+    later call returns the same Settings object. Tests can call
+    get_settings.cache_clear() to force a reload.
+    
+    Returns:
+        The shared Settings instance
+    """
+    return Settings()
+
+
 # Create a global instance of our settings
 # This makes settings available throughout the app as: settings.openai_api_key
-settings = Settings()
+settings = get_settings()
+
+# Values that never change after startup, bound once as plain module names.
+# Code that reads them often can import these directly instead of going
+# through the helper classes below.
+DATABASE_URL = settings.database_url
+CHECK_INTERVAL_MINUTES = settings.check_interval_minutes
+ALERT_THRESHOLD_PERCENT = settings.alert_threshold_percent
+TWILIO_ACCOUNT_SID = settings.twilio_account_sid
+TWILIO_AUTH_TOKEN = settings.twilio_auth_token
+TWILIO_PHONE_NUMBER = settings.twilio_phone_number
+USER_PHONE_NUMBER = settings.user_phone_number
 
 
 class DatabaseConfig:
@@ -200,23 +237,24 @@ class DatabaseConfig:
     Database configuration helper.
     
     Provides database-specific settings and connection management.
+    Kept for existing callers; the values come from the constants above.
     """
     
     @staticmethod
     def get_database_url() -> str:
         """Get the database URL from settings."""
-        return settings.database_url
+        return DATABASE_URL
     
     @staticmethod
     def is_sqlite() -> bool:
         """Check if using SQLite database."""
-        return settings.database_url.startswith("sqlite")
+        return DATABASE_URL.startswith("sqlite")
     
     @staticmethod
     def get_sqlite_path() -> str:
         """Get SQLite database file path."""
-        if settings.database_url.startswith("sqlite:///"):
-            return settings.database_url.replace("sqlite:///", "")
+        if DATABASE_URL.startswith("sqlite:///"):
+            return DATABASE_URL.replace("sqlite:///", "")
         return "stocks.db"
 
 
@@ -225,17 +263,18 @@ class SchedulerConfig:
     Scheduler configuration helper.
     
     Provides settings for the APScheduler cron jobs.
+    Kept for existing callers; the values come from the constants above.
     """
     
     @staticmethod
     def get_check_interval() -> int:
         """Get stock check interval in minutes."""
-        return settings.check_interval_minutes
+        return CHECK_INTERVAL_MINUTES
     
     @staticmethod
     def get_alert_threshold() -> float:
         """Get alert threshold percentage."""
-        return settings.alert_threshold_percent
+        return ALERT_THRESHOLD_PERCENT
 
 
 class TwilioConfig:
@@ -243,24 +282,25 @@ class TwilioConfig:
     Twilio configuration helper.
     
     Provides Twilio-specific settings and validation.
+    Kept for existing callers; the values come from the constants above.
     """
     
     @staticmethod
     def get_account_sid() -> str:
         """Get Twilio Account SID."""
-        return settings.twilio_account_sid
+        return TWILIO_ACCOUNT_SID
     
     @staticmethod
     def get_auth_token() -> str:
         """Get Twilio Auth Token."""
-        return settings.twilio_auth_token
+        return TWILIO_AUTH_TOKEN
     
     @staticmethod
     def get_phone_number() -> str:
         """Get Twilio phone number."""
-        return settings.twilio_phone_number
+        return TWILIO_PHONE_NUMBER
     
     @staticmethod
     def get_user_phone() -> str:
         """Get user's phone number."""
-        return settings.user_phone_number
+        return USER_PHONE_NUMBER
@@ -18,11 +18,21 @@ errors and make our code more reliable.
 """
 
 # Standard library imports
-from typing import Optional, Dict, Any  # For optional values and dictionaries
+from typing import Optional, Dict, Any, Literal  # For optional values, dictionaries and fixed choices
 from datetime import datetime  # For dates and times
 
 # Third-party imports
-from pydantic import BaseModel, Field, validator  # For data models and validation
+from pydantic import BaseModel, ConfigDict, Field, field_validator  # For data models and validation
+
+
+# Allowed values for the "choice" fields below. Using Literal types lets
+# pydantic check the value for us, so we don't need a validator for each one.
+MessageDirection = Literal['inbound', 'outbound']
+MessageStatus = Literal['pending', 'sent', 'delivered', 'failed', 'undelivered']
+CommandType = Literal['add', 'remove', 'list', 'help', 'status', 'settings']
+MessageType = Literal['text', 'alert', 'error', 'confirmation']
+MessagePriority = Literal['low', 'normal', 'high', 'urgent']
+UrgencyLevel = Literal['low', 'normal', 'high', 'critical']
 
 
 class SMSMessage(BaseModel):
@@ -52,8 +62,8 @@ class SMSMessage(BaseModel):
     from_number: str = Field(..., description="Sender phone number")
     to_number: str = Field(..., description="Recipient phone number")
     body: str = Field(..., description="Message content")
-    status: str = Field(default="pending", description="Message status")
-    direction: str = Field(..., description="Message direction: inbound or outbound")
+    status: MessageStatus = Field(default="pending", description="Message status")
+    direction: MessageDirection = Field(..., description="Message direction: inbound or outbound")
     twilio_sid: Optional[str] = Field(None, description="Twilio message SID")
     created_at: datetime = Field(default_factory=datetime.utcnow, description="Message creation time")
     sent_at: Optional[datetime] = Field(None, description="When message was sent")
@@ -61,28 +71,22 @@ class SMSMessage(BaseModel):
     error_code: Optional[str] = Field(None, description="Error code if message failed")
     error_message: Optional[str] = Field(None, description="Error message if message failed")
     
-    @validator('direction')
-    def validate_direction(cls, v):
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "SMSMessage":
         """
-        Validate message direction.
+        Build a message from data our own code produced, skipping validation.
         
-        This makes sure the direction is either 'inbound' (coming in) or 'outbound' (going out).
-        """
-        if v not in ['inbound', 'outbound']:
-            raise ValueError("Direction must be 'inbound' or 'outbound'")
-        return v
-    
-    @validator('status')
-    def validate_status(cls, v):
-        """
-        Validate message status.
+        Only use this for trusted data (records we create ourselves). Anything
+        coming from outside, like a webhook, should go through the normal
+        constructor so it gets checked.
         
-        This makes sure the status is one of the valid states a message can be in.
+        Args:
+            row: Dictionary of field values
+            
+        Returns:
+            SMSMessage built without running validators
         """
-        valid_statuses = ['pending', 'sent', 'delivered', 'failed', 'undelivered']
-        if v not in valid_statuses:
-            raise ValueError(f"Status must be one of: {valid_statuses}")
-        return v
+        return cls.model_construct(**row)
 
 
 class TwilioWebhook(BaseModel):
@@ -93,14 +97,18 @@ class TwilioWebhook(BaseModel):
     when an SMS is received or status is updated.
     """
     
+    # Webhook data never changes once received. Twilio sends many more form
+    # fields than we model, so extra fields are ignored rather than rejected.
+    model_config = ConfigDict(frozen=True)
+    
     # Message identification
     MessageSid: str = Field(..., description="Twilio message SID")
     AccountSid: str = Field(..., description="Twilio account SID")
     
     # Message details
-    From: str = Field(..., description="Sender phone number")
-    To: str = Field(..., description="Recipient phone number")
-    Body: str = Field(..., description="Message content")
+    From: str = Field(..., min_length=1, description="Sender phone number")
+    To: str = Field(..., min_length=1, description="Recipient phone number")
+    Body: str = Field(..., max_length=1600, description="Message content (SMS limit is 1600 characters)")
     
     # Status information
     MessageStatus: str = Field(..., description="Message status")
@@ -113,22 +121,6 @@ class TwilioWebhook(BaseModel):
     # Error information (if applicable)
     ErrorCode: Optional[str] = Field(None, description="Error code")
     ErrorMessage: Optional[str] = Field(None, description="Error message")
-    
-    @validator('From', 'To')
-    def validate_phone_numbers(cls, v):
-        """Validate phone number format."""
-        if not v or not isinstance(v, str):
-            raise ValueError("Phone number must be a non-empty string")
-        return v
-    
-    @validator('Body')
-    def validate_message_body(cls, v):
-        """Validate message body."""
-        if not isinstance(v, str):
-            raise ValueError("Message body must be a string")
-        if len(v) > 1600:  # SMS character limit
-            raise ValueError("Message body too long")
-        return v
 
 
 class SMSCommand(BaseModel):
@@ -139,22 +131,15 @@ class SMSCommand(BaseModel):
     extracted from an SMS message.
     """
     
-    command_type: str = Field(..., description="Type of command (add, remove, list, help)")
+    command_type: CommandType = Field(..., description="Type of command (add, remove, list, help)")
     symbol: Optional[str] = Field(None, description="Stock symbol (for add/remove commands)")
     original_message: str = Field(..., description="Original SMS message")
     confidence: float = Field(default=1.0, description="Command parsing confidence (0-1)")
     parameters: Dict[str, Any] = Field(default_factory=dict, description="Additional command parameters")
     created_at: datetime = Field(default_factory=datetime.utcnow, description="Command parsing time")
     
-    @validator('command_type')
-    def validate_command_type(cls, v):
-        """Validate command type."""
-        valid_commands = ['add', 'remove', 'list', 'help', 'status', 'settings']
-        if v not in valid_commands:
-            raise ValueError(f"Command type must be one of: {valid_commands}")
-        return v
-    
-    @validator('confidence')
+    @field_validator('confidence')
+    @classmethod
     def validate_confidence(cls, v):
         """Validate confidence score."""
         if not 0 <= v <= 1:
@@ -170,28 +155,15 @@ class SMSResponse(BaseModel):
     sent back to users via SMS.
     """
     
+    # Responses are built once and never changed
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     to_number: str = Field(..., description="Recipient phone number")
     message: str = Field(..., description="Response message content")
-    message_type: str = Field(default="text", description="Type of message (text, alert, error)")
-    priority: str = Field(default="normal", description="Message priority (low, normal, high)")
+    message_type: MessageType = Field(default="text", description="Type of message (text, alert, error)")
+    priority: MessagePriority = Field(default="normal", description="Message priority (low, normal, high)")
     scheduled_at: Optional[datetime] = Field(None, description="When to send message (for scheduling)")
     created_at: datetime = Field(default_factory=datetime.utcnow, description="Response creation time")
-    
-    @validator('message_type')
-    def validate_message_type(cls, v):
-        """Validate message type."""
-        valid_types = ['text', 'alert', 'error', 'confirmation']
-        if v not in valid_types:
-            raise ValueError(f"Message type must be one of: {valid_types}")
-        return v
-    
-    @validator('priority')
-    def validate_priority(cls, v):
-        """Validate message priority."""
-        valid_priorities = ['low', 'normal', 'high', 'urgent']
-        if v not in valid_priorities:
-            raise ValueError(f"Priority must be one of: {valid_priorities}")
-        return v
 
 
 class SMSAlert(BaseModel):
@@ -202,6 +174,9 @@ class SMSAlert(BaseModel):
     with AI-generated analysis.
     """
     
+    # Alerts are built once and never changed
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     symbol: str = Field(..., description="Stock symbol")
     current_price: float = Field(..., description="Current stock price")
     previous_price: float = Field(..., description="Previous stock price")
@@ -209,13 +184,5 @@ class SMSAlert(BaseModel):
     alert_message: str = Field(..., description="AI-generated alert message")
     news_summary: Optional[str] = Field(None, description="News summary")
     analysis: Optional[str] = Field(None, description="AI analysis")
-    urgency_level: str = Field(default="normal", description="Alert urgency level")
+    urgency_level: UrgencyLevel = Field(default="normal", description="Alert urgency level")
     created_at: datetime = Field(default_factory=datetime.utcnow, description="Alert creation time")
-    
-    @validator('urgency_level')
-    def validate_urgency(cls, v):
-        """Validate urgency level."""
-        valid_levels = ['low', 'normal', 'high', 'critical']
-        if v not in valid_levels:
-            raise ValueError(f"Urgency level must be one of: {valid_levels}")
-        return v
@@ -19,12 +19,16 @@ and make sure our data is always in the right format.
 """
 
 # Standard library imports
-from typing import Optional, List  # For optional values and lists
+from typing import Annotated, Optional, List  # For optional values, lists and constrained types
 from datetime import datetime  # For dates and times
-from decimal import Decimal  # For precise financial calculations
 
 # Third-party imports
-from pydantic import BaseModel, Field, validator  # For data models and validation
+from pydantic import BaseModel, Field, StringConstraints, field_validator  # For data models and validation
+
+
+# A stock symbol: surrounding spaces removed, uppercased (AAPL not aapl) and
+# never empty. Pydantic applies these rules itself, so no validator is needed.
+StockSymbol = Annotated[str, StringConstraints(min_length=1, strip_whitespace=True, to_upper=True)]
 
 
 class Stock(BaseModel):
@@ -45,30 +49,16 @@ class Stock(BaseModel):
         is_active: Whether we're still tracking this stock (user can pause tracking)
     """
     
-    symbol: str = Field(..., description="Stock symbol (e.g., AAPL, TSLA)")
+    symbol: StockSymbol = Field(..., description="Stock symbol (e.g., AAPL, TSLA)")
     name: Optional[str] = Field(None, description="Company name")
-    current_price: Optional[Decimal] = Field(None, description="Current stock price")
-    previous_price: Optional[Decimal] = Field(None, description="Previous recorded price")
+    current_price: Optional[float] = Field(None, description="Current stock price")
+    previous_price: Optional[float] = Field(None, description="Previous recorded price")
     added_date: datetime = Field(default_factory=datetime.utcnow, description="When stock was added")
     last_checked: Optional[datetime] = Field(None, description="Last time price was checked")
     is_active: bool = Field(default=True, description="Whether stock is actively tracked")
     
-    @validator('symbol')
-    def validate_symbol(cls, v):
-        """
-        Validate stock symbol format.
-        
-        This makes sure the stock symbol is:
-        - Not empty
-        - A string (not a number or other type)
-        - Converted to uppercase (AAPL not aapl)
-        - Trimmed of extra spaces
-        """
-        if not v or not isinstance(v, str):
-            raise ValueError("Stock symbol must be a non-empty string")
-        return v.upper().strip()
-    
-    @validator('current_price', 'previous_price')
+    @field_validator('current_price', 'previous_price')
+    @classmethod
     def validate_price(cls, v):
         """
         Validate price values.
@@ -88,20 +78,12 @@ class StockPrice(BaseModel):
     at a specific point in time.
     """
     
-    symbol: str = Field(..., description="Stock symbol")
-    price: Decimal = Field(..., description="Stock price")
+    symbol: StockSymbol = Field(..., description="Stock symbol")
+    price: float = Field(..., description="Stock price")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Price timestamp")
     volume: Optional[int] = Field(None, description="Trading volume")
-    change: Optional[Decimal] = Field(None, description="Price change from previous close")
-    change_percent: Optional[Decimal] = Field(None, description="Percentage change")
-    
-    @validator('price', 'change', 'change_percent')
-    def validate_decimal_fields(cls, v):
-        """Validate decimal fields."""
-        if v is not None and v < 0 and v != 0:
-            # Allow negative values for change and change_percent
-            pass
-        return v
+    change: Optional[float] = Field(None, description="Price change from previous close")
+    change_percent: Optional[float] = Field(None, description="Percentage change")
 
 
 class StockAlert(BaseModel):
@@ -113,24 +95,16 @@ class StockAlert(BaseModel):
     """
     
     id: Optional[int] = Field(None, description="Alert ID")
-    symbol: str = Field(..., description="Stock symbol")
-    previous_price: Decimal = Field(..., description="Previous price")
-    current_price: Decimal = Field(..., description="Current price")
-    change_percent: Decimal = Field(..., description="Percentage change")
-    threshold_percent: Decimal = Field(..., description="Alert threshold percentage")
+    symbol: StockSymbol = Field(..., description="Stock symbol")
+    previous_price: float = Field(..., description="Previous price")
+    current_price: float = Field(..., description="Current price")
+    change_percent: float = Field(..., description="Percentage change")
+    threshold_percent: float = Field(..., description="Alert threshold percentage")
     alert_message: str = Field(..., description="AI-generated alert message")
     news_summary: Optional[str] = Field(None, description="News summary for the price change")
     created_at: datetime = Field(default_factory=datetime.utcnow, description="Alert creation time")
     sent_at: Optional[datetime] = Field(None, description="When alert was sent via SMS")
     is_sent: bool = Field(default=False, description="Whether alert was sent")
-    
-    @validator('change_percent', 'threshold_percent')
-    def validate_percentages(cls, v):
-        """Validate percentage values."""
-        if v is None:
-            return v
-        # Allow both positive and negative percentages
-        return v
 
 
 class StockNews(BaseModel):
@@ -158,8 +132,8 @@ class MarketData(BaseModel):
     """
     
     market_index: str = Field(..., description="Market index (e.g., SPY, QQQ)")
-    current_value: Decimal = Field(..., description="Current index value")
-    change_percent: Decimal = Field(..., description="Index change percentage")
+    current_value: float = Field(..., description="Current index value")
+    change_percent: float = Field(..., description="Index change percentage")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Data timestamp")
 
 
@@ -171,7 +145,7 @@ class StockAnalysis(BaseModel):
     price moved and what it means.
     """
     
-    symbol: str = Field(..., description="Stock symbol")
+    symbol: StockSymbol = Field(..., description="Stock symbol")
     analysis: str = Field(..., description="AI-generated analysis")
     confidence_score: Optional[float] = Field(None, description="Analysis confidence (0-1)")
     key_factors: List[str] = Field(default_factory=list, description="Key factors identified")
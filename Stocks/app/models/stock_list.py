@@ -6,8 +6,10 @@ that are being monitored for price changes and alerts.
 """
 
 from datetime import datetime
-from typing import Optional, List, Union
-from pydantic import BaseModel, Field, validator
+from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError, computed_field, field_validator
+
+from .stock import StockSymbol
 
 
 class TrackedStock(BaseModel):
@@ -22,22 +24,26 @@ class TrackedStock(BaseModel):
     id: Optional[int] = Field(None, description="Unique stock ID")
     
     # Stock information
-    symbol: str = Field(..., description="Stock symbol (e.g., AAPL, TSLA)")
+    symbol: StockSymbol = Field(..., description="Stock symbol (e.g., AAPL, TSLA)")
     name: Optional[str] = Field(None, description="Company name (e.g., Apple Inc.)")
     
-    # Tracking settings
-    added_date: Union[datetime, str] = Field(default_factory=datetime.utcnow, description="When this stock was added to tracking")
+    # Tracking settings (pydantic parses ISO strings from the JSON file itself)
+    added_date: datetime = Field(default_factory=datetime.utcnow, description="When this stock was added to tracking")
     is_active: bool = Field(default=True, description="Whether this stock is actively being monitored")
     
-    @validator('added_date', pre=True)
-    def parse_added_date(cls, v):
-        """Parse added_date from string or datetime."""
-        if isinstance(v, str):
-            try:
-                return datetime.fromisoformat(v.replace('Z', '+00:00'))
-            except ValueError:
-                return datetime.utcnow()
-        return v
+    @field_validator('added_date', mode='wrap')
+    @classmethod
+    def parse_added_date(cls, v, handler):
+        """
+        Parse added_date, falling back to now if the value can't be parsed.
+        
+        One bad date in tracked_stocks.json must not make the whole file fail
+        to load (the service would then replace it with the default stocks).
+        """
+        try:
+            return handler(v)
+        except ValidationError:
+            return datetime.utcnow()
     
     # Alert preferences (can be customized per stock)
     alert_threshold: float = Field(default=1.0, description="Price change threshold for alerts (percentage)")
@@ -47,52 +53,51 @@ class TrackedStock(BaseModel):
     
     # Note: Price tracking is now handled on-demand in the web interface
     # This keeps the model simple and avoids persistence issues
-    
-    class Config:
-        """Pydantic configuration for the model."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
+# Validator for a whole list of tracked stocks (e.g. the JSON storage file).
+# validate_json() parses and validates the list in a single pydantic-core call
+# instead of json.load() followed by TrackedStock(**row) for every row.
+TRACKED_STOCK_LIST = TypeAdapter(List[TrackedStock])
 
-class StockListResponse(BaseModel):
+
+class StockListResponse(TrackedStock):
     """
     Response model for stock list API endpoints.
     
     This is used when returning stock list data to the user,
     with additional computed fields for better user experience.
+    The basic stock fields (symbol, name, added_date, ...) are inherited
+    from TrackedStock so they're only declared once.
     """
     
-    # Basic stock information
-    id: int
-    symbol: str
-    name: Optional[str]
-    added_date: Union[datetime, str]
-    is_active: bool
-    alert_threshold: float
-    notes: Optional[str]
-    
-    @validator('added_date', pre=True)
-    def parse_added_date(cls, v):
-        """Parse added_date from string or datetime."""
-        if isinstance(v, str):
-            try:
-                return datetime.fromisoformat(v.replace('Z', '+00:00'))
-            except ValueError:
-                return datetime.utcnow()
-        return v
+    # Stocks in the list always have an ID, so it isn't optional here
+    id: int = Field(..., description="Unique stock ID")
     
     # Computed fields for better user experience
-    days_tracked: int = Field(..., description="Number of days this stock has been tracked")
+    @computed_field(description="Number of days this stock has been tracked")
+    @property
+    def days_tracked(self) -> int:
+        """Whole days since the stock was added (included in model_dump and JSON)."""
+        return (datetime.utcnow() - self.added_date).days
     
     # Note: current_price and last_alert are now fetched on-demand in the web interface
     # This avoids persistence issues and ensures fresh data
     
-    class Config:
-        """Pydantic configuration for the response model."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "StockListResponse":
+        """
+        Build a response from trusted data without running validation.
+        
+        Use this for data our own code already validated (like a TrackedStock
+        from the stock list); user input should go through the normal constructor.
+        
+        Args:
+            row: Dictionary of field values
+            
+        Returns:
+            StockListResponse built without running validators
+        """
+        return cls.model_construct(**row)
 
 
 class StockListSummary(BaseModel):
@@ -109,11 +114,21 @@ class StockListSummary(BaseModel):
     most_recent_addition: Optional[datetime] = Field(None, description="When the most recent stock was added")
     average_threshold: float = Field(..., description="Average alert threshold across all stocks")
     
-    class Config:
-        """Pydantic configuration for the summary model."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "StockListSummary":
+        """
+        Build a summary from trusted data without running validation.
+        
+        Use this for data our own code already validated (like a TrackedStock
+        from the stock list); user input should go through the normal constructor.
+        
+        Args:
+            row: Dictionary of field values
+            
+        Returns:
+            StockListSummary built without running validators
+        """
+        return cls.model_construct(**row)
 
 
 class AddStockRequest(BaseModel):
@@ -124,14 +139,14 @@ class AddStockRequest(BaseModel):
     a new stock to be monitored.
     """
     
-    symbol: str = Field(..., description="Stock symbol to add (e.g., AAPL, TSLA)")
+    symbol: StockSymbol = Field(..., description="Stock symbol to add (e.g., AAPL, TSLA)")
     name: Optional[str] = Field(None, description="Company name (optional, will be fetched if not provided)")
     alert_threshold: float = Field(default=1.0, ge=0.1, le=50.0, description="Alert threshold percentage (0.1-50.0)")
     notes: Optional[str] = Field(None, description="Optional notes about this stock")
     
-    class Config:
-        """Pydantic configuration for the request model."""
-        schema_extra = {
+    # Pydantic configuration for the request model
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "symbol": "AAPL",
                 "name": "Apple Inc.",
@@ -139,6 +154,7 @@ class AddStockRequest(BaseModel):
                 "notes": "Tech giant, watch for earnings announcements"
             }
         }
+    )
 
 
 class UpdateStockRequest(BaseModel):
@@ -154,9 +170,9 @@ class UpdateStockRequest(BaseModel):
     alert_threshold: Optional[float] = Field(None, ge=0.1, le=50.0, description="Alert threshold percentage")
     notes: Optional[str] = Field(None, description="Notes about this stock")
     
-    class Config:
-        """Pydantic configuration for the request model."""
-        schema_extra = {
+    # Pydantic configuration for the request model
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "Apple Inc.",
                 "is_active": True,
@@ -164,3 +180,4 @@ class UpdateStockRequest(BaseModel):
                 "notes": "Updated notes about Apple"
             }
         }
+    )
@@ -5,10 +5,14 @@ This module contains models for user data, preferences,
 and settings management.
 """
 
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, Field, StringConstraints
+from typing import Annotated, Optional, List, Dict, Any, Literal
 from datetime import datetime
-from decimal import Decimal
+
+
+# A phone number with at least 10 digits. Other characters (spaces, dashes,
+# brackets, a leading +) may appear around them. Checked by pydantic's regex engine.
+PhoneNumber = Annotated[str, StringConstraints(min_length=10, pattern=r'^\D*(?:\d\D*){10,}$')]
 
 
 class User(BaseModel):
@@ -20,22 +24,11 @@ class User(BaseModel):
     """
     
     id: Optional[int] = Field(None, description="User ID")
-    phone_number: str = Field(..., description="User's phone number")
+    phone_number: PhoneNumber = Field(..., description="User's phone number")
     name: Optional[str] = Field(None, description="User's name")
     created_at: datetime = Field(default_factory=datetime.utcnow, description="Account creation time")
     last_active: Optional[datetime] = Field(None, description="Last activity timestamp")
     is_active: bool = Field(default=True, description="Whether user account is active")
-    
-    @validator('phone_number')
-    def validate_phone_number(cls, v):
-        """Validate phone number format."""
-        if not v or not isinstance(v, str):
-            raise ValueError("Phone number must be a non-empty string")
-        # Basic phone number validation (can be enhanced)
-        cleaned = ''.join(filter(str.isdigit, v))
-        if len(cleaned) < 10:
-            raise ValueError("Phone number must have at least 10 digits")
-        return v
 
 
 class UserPreferences(BaseModel):
@@ -47,16 +40,22 @@ class UserPreferences(BaseModel):
     """
     
     user_id: int = Field(..., description="Associated user ID")
-    alert_threshold_percent: Decimal = Field(
-        default=Decimal("5.0"), 
+    alert_threshold_percent: float = Field(
+        default=5.0, 
+        gt=0,
+        le=100,  # a percentage
         description="Default alert threshold percentage"
     )
     check_interval_minutes: int = Field(
         default=60, 
+        ge=1,
+        le=1440,  # 24 hours
         description="Default check interval in minutes"
     )
     max_stocks: int = Field(
         default=20, 
+        ge=1,
+        le=100,
         description="Maximum number of stocks to track"
     )
     enable_news_summaries: bool = Field(
@@ -75,39 +74,12 @@ class UserPreferences(BaseModel):
         default="en", 
         description="Preferred language for alerts"
     )
-    alert_frequency: str = Field(
+    alert_frequency: Literal["immediate", "daily", "weekly"] = Field(
         default="immediate", 
         description="Alert frequency: immediate, daily, weekly"
     )
     created_at: datetime = Field(default_factory=datetime.utcnow, description="Preferences creation time")
     updated_at: datetime = Field(default_factory=datetime.utcnow, description="Last update time")
-    
-    @validator('alert_threshold_percent')
-    def validate_threshold(cls, v):
-        """Validate alert threshold."""
-        if v <= 0:
-            raise ValueError("Alert threshold must be positive")
-        if v > 100:
-            raise ValueError("Alert threshold cannot exceed 100%")
-        return v
-    
-    @validator('check_interval_minutes')
-    def validate_interval(cls, v):
-        """Validate check interval."""
-        if v < 1:
-            raise ValueError("Check interval must be at least 1 minute")
-        if v > 1440:  # 24 hours
-            raise ValueError("Check interval cannot exceed 24 hours")
-        return v
-    
-    @validator('max_stocks')
-    def validate_max_stocks(cls, v):
-        """Validate maximum stocks."""
-        if v < 1:
-            raise ValueError("Must allow at least 1 stock")
-        if v > 100:
-            raise ValueError("Cannot track more than 100 stocks")
-        return v
 
 
 class UserSession(BaseModel):
@@ -0,0 +1,25 @@
+"""
+Shared response classes for the AI Stock Tracking Agent.
+
+The app and its routers both use these, so they live in their own small
+module instead of main.py (routers can't import from main.py without
+creating a circular import).
+"""
+
+from typing import Any
+
+import orjson  # Fast JSON serializer
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson instead of the standard json module.
+    
+    orjson is several times faster than json.dumps and understands datetime,
+    UUID and NumPy values on its own. We keep our own small class because
+    FastAPI's built-in ORJSONResponse is deprecated in newer releases.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
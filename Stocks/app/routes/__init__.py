@@ -3,14 +3,52 @@ Routes package for the AI Stock Tracking Agent.
 
 This package contains all FastAPI route handlers including
 webhooks, API endpoints, and health checks.
+
+Routers are loaded lazily (PEP 562): each route module creates its
+services when it is imported, so we only pay that cost for the routers
+that are actually asked for. Importing a single submodule such as
+``app.routes.health`` no longer drags in every other router.
 """
 
-from .webhooks import router as webhooks_router
-from .api import router as api_router
-from .health import router as health_router
+import importlib
+
+# Public router name -> submodule that defines it, in registration order.
+# The dashboard router owns "/" so it must stay ahead of the root endpoint
+# defined in main.py.
+_ROUTER_MODULES = {
+    "webhooks_router": "webhooks",
+    "api_router": "api",
+    "health_router": "health",
+    "alert_history_router": "alert_history",
+    "dashboard_router": "dashboard",
+    "stock_list_router": "stock_list",
+    "alert_preferences_router": "alert_preferences",
+}
+
+
+def __getattr__(name):
+    """Import a router (or the full ALL_ROUTERS list) on first access."""
+    if name in _ROUTER_MODULES:
+        module = importlib.import_module(f".{_ROUTER_MODULES[name]}", __name__)
+        router = module.router
+        # Cache on the package so later lookups skip __getattr__ entirely
+        globals()[name] = router
+        return router
+    if name == "ALL_ROUTERS":
+        # Every router the app serves, in registration order
+        routers = [__getattr__(router_name) for router_name in _ROUTER_MODULES]
+        globals()[name] = routers
+        return routers
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "webhooks_router",
     "api_router", 
-    "health_router"
+    "health_router",
+    "alert_history_router",
+    "dashboard_router",
+    "stock_list_router",
+    "alert_preferences_router",
+    "ALL_ROUTERS"
 ]
@@ -7,10 +7,15 @@ including recent alerts, alerts by symbol, and alert summaries.
 
 import logging
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import JSONResponse
+
+import orjson  # Fast JSON serializer
+from cachetools import TTLCache  # Small cache whose entries expire on their own
+from fastapi import APIRouter, HTTPException, Path, Query
+from fastapi.responses import Response
+from pydantic import TypeAdapter
 
 from ..models.alert_history import AlertHistoryResponse, AlertHistorySummary
+from ..responses import ORJSONResponse
 from ..services.alert_history_service import AlertHistoryService
 
 # Configure logging
@@ -19,9 +24,46 @@ logger = logging.getLogger(__name__)
 # Create router for alert history endpoints
 router = APIRouter(prefix="/api/v1/alerts", tags=["alert-history"])
 
+# Allowed stock symbols in URLs: letters, digits, dots and dashes (e.g., AAPL, BRK.B).
+# FastAPI rejects anything else with a 422 before the handler runs.
+SYMBOL_PATTERN = r"^[A-Za-z0-9.\-]+$"
+
 # Initialize the alert history service
 alert_history_service = AlertHistoryService()
 
+# AlertHistorySummary is a Pydantic dataclass, so it is dumped through a TypeAdapter
+summary_adapter = TypeAdapter(AlertHistorySummary)
+
+# Dumps a whole list of alerts to JSON bytes in one pydantic-core call.
+# The bytes are embedded in the response with orjson.Fragment, so the alerts
+# are never turned into Python dicts just to be encoded again.
+alerts_adapter = TypeAdapter(List[AlertHistoryResponse])
+
+# Rendered JSON bodies of the read-only endpoints, kept for a few seconds.
+# The dashboard polls these, but alert history only changes when a price
+# check sends an alert. Keys include the number of stored alerts so a new
+# alert shows up right away; clearing the history empties the caches.
+HISTORY_CACHE_TTL = 2  # Seconds
+SUMMARY_CACHE_TTL = 10
+STATUS_CACHE_TTL = 30
+_history_cache = TTLCache(maxsize=256, ttl=HISTORY_CACHE_TTL)
+_summary_cache = TTLCache(maxsize=4, ttl=SUMMARY_CACHE_TTL)
+_status_cache = TTLCache(maxsize=4, ttl=STATUS_CACHE_TTL)
+
+
+def _cached_response(cache: TTLCache, key) -> Optional[Response]:
+    """Return the cached JSON body for key as a response, or None on a miss."""
+    body = cache.get(key)
+    if body is None:
+        return None
+    return Response(content=body, media_type="application/json")
+
+
+def _remember(cache: TTLCache, key, response: ORJSONResponse) -> ORJSONResponse:
+    """Store a freshly rendered response body in the cache and return the response."""
+    cache[key] = response.body
+    return response
+
 
 @router.get("/history", response_model=List[AlertHistoryResponse])
 async def get_recent_alerts(limit: int = Query(10, ge=1, le=50, description="Number of recent alerts to return")):
@@ -38,20 +80,25 @@ async def get_recent_alerts(limit: int = Query(10, ge=1, le=50, description="Num
         List of recent alerts with computed fields
     """
     try:
-        logger.info(f"Getting recent alerts (limit: {limit})")
+        cache_key = ("recent", limit, len(alert_history_service.alerts))
+        cached = _cached_response(_history_cache, cache_key)
+        if cached is not None:
+            return cached
+        
+        logger.info("Getting recent alerts (limit: %s)", limit)
         alerts = alert_history_service.get_recent_alerts(limit=limit)
         
-        return JSONResponse(
+        return _remember(_history_cache, cache_key, ORJSONResponse(
             status_code=200,
             content={
-                "alerts": [alert.model_dump(mode='json') for alert in alerts] if alerts else [],
+                "alerts": orjson.Fragment(alerts_adapter.dump_json(alerts)) if alerts else [],
                 "count": len(alerts) if alerts else 0,
                 "message": f"Retrieved {len(alerts)} recent alerts"
             }
-        )
+        ))
         
     except Exception as e:
-        logger.error(f"Error getting recent alerts: {str(e)}")
+        logger.error("Error getting recent alerts: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to retrieve alert history: {str(e)}"
@@ -60,7 +107,13 @@ async def get_recent_alerts(limit: int = Query(10, ge=1, le=50, description="Num
 
 @router.get("/history/{symbol}", response_model=List[AlertHistoryResponse])
 async def get_alerts_by_symbol(
-    symbol: str,
+    symbol: str = Path(
+        ...,
+        min_length=1,
+        max_length=10,
+        pattern=SYMBOL_PATTERN,
+        description="Stock symbol (e.g., AAPL, TSLA)"
+    ),
     limit: int = Query(10, ge=1, le=50, description="Number of alerts to return")
 ):
     """
@@ -76,31 +129,29 @@ async def get_alerts_by_symbol(
         List of alerts for the specified symbol
     """
     try:
-        # Validate symbol format
-        symbol = symbol.upper().strip()
-        if not symbol or len(symbol) > 10:
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid stock symbol format"
-            )
+        # FastAPI already checked the symbol format against SYMBOL_PATTERN
+        symbol = symbol.upper()
+        
+        cache_key = (symbol, limit, len(alert_history_service.alerts))
+        cached = _cached_response(_history_cache, cache_key)
+        if cached is not None:
+            return cached
         
-        logger.info(f"Getting alerts for symbol: {symbol} (limit: {limit})")
+        logger.info("Getting alerts for symbol: %s (limit: %s)", symbol, limit)
         alerts = alert_history_service.get_alerts_by_symbol(symbol=symbol, limit=limit)
         
-        return JSONResponse(
+        return _remember(_history_cache, cache_key, ORJSONResponse(
             status_code=200,
             content={
                 "symbol": symbol,
-                "alerts": [alert.model_dump(mode='json') for alert in alerts] if alerts else [],
+                "alerts": orjson.Fragment(alerts_adapter.dump_json(alerts)) if alerts else [],
                 "count": len(alerts) if alerts else 0,
                 "message": f"Retrieved {len(alerts)} alerts for {symbol}"
             }
-        )
+        ))
         
-    except HTTPException:
-        raise
     except Exception as e:
-        logger.error(f"Error getting alerts for {symbol}: {str(e)}")
+        logger.error("Error getting alerts for %s: %s", symbol, e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to retrieve alerts for {symbol}: {str(e)}"
@@ -119,19 +170,24 @@ async def get_alert_summary():
         Summary statistics about alert history
     """
     try:
+        cache_key = len(alert_history_service.alerts)
+        cached = _cached_response(_summary_cache, cache_key)
+        if cached is not None:
+            return cached
+        
         logger.info("Getting alert history summary")
         summary = alert_history_service.get_alert_summary()
         
-        return JSONResponse(
+        return _remember(_summary_cache, cache_key, ORJSONResponse(
             status_code=200,
             content={
-                "summary": summary.model_dump(mode='json') if summary else None,
+                "summary": orjson.Fragment(summary_adapter.dump_json(summary)) if summary else None,
                 "message": "Alert history summary retrieved successfully"
             }
-        )
+        ))
         
     except Exception as e:
-        logger.error(f"Error getting alert summary: {str(e)}")
+        logger.error("Error getting alert summary: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to retrieve alert summary: {str(e)}"
@@ -153,8 +209,13 @@ async def clear_alert_history():
         logger.warning("Clearing all alert history")
         success = alert_history_service.clear_history()
         
+        # Cached responses may still hold the old alerts
+        _history_cache.clear()
+        _summary_cache.clear()
+        _status_cache.clear()
+        
         if success:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=200,
                 content={
                     "message": "Alert history cleared successfully",
@@ -170,7 +231,7 @@ async def clear_alert_history():
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error clearing alert history: {str(e)}")
+        logger.error("Error clearing alert history: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to clear alert history: {str(e)}"
@@ -189,39 +250,25 @@ async def get_alert_service_status():
         Service status information
     """
     try:
+        cache_key = len(alert_history_service.alerts)
+        cached = _cached_response(_status_cache, cache_key)
+        if cached is not None:
+            return cached
+        
         logger.info("Getting alert history service status")
         
-        # Get basic statistics
-        summary = alert_history_service.get_alert_summary()
+        status = alert_history_service.get_service_status()
         
-        # Check storage file status
-        import os
-        storage_file = alert_history_service.storage_file
-        file_exists = os.path.exists(storage_file)
-        file_size = os.path.getsize(storage_file) if file_exists else 0
-        
-        status = {
-            "service": "Alert History Service",
-            "status": "operational",
-            "storage_file": storage_file,
-            "file_exists": file_exists,
-            "file_size_bytes": file_size,
-            "total_alerts": summary.total_alerts,
-            "alerts_today": summary.alerts_today,
-            "last_alert_time": summary.last_alert_time,
-            "timestamp": "2024-01-01T00:00:00Z"
-        }
-        
-        return JSONResponse(
+        return _remember(_status_cache, cache_key, ORJSONResponse(
             status_code=200,
             content={
                 "status": status,
                 "message": "Alert history service status retrieved successfully"
             }
-        )
+        ))
         
     except Exception as e:
-        logger.error(f"Error getting alert service status: {str(e)}")
+        logger.error("Error getting alert service status: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to retrieve alert service status: {str(e)}"
@@ -6,15 +6,19 @@ user alert preferences including thresholds, frequency, and notification setting
 """
 
 import logging
+import os
+import time
 from typing import Optional
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+
+import orjson  # Fast JSON serializer
+from fastapi import APIRouter, HTTPException, Request
 
 from ..models.alert_preferences import (
     AlertPreferencesResponse, 
     AlertPreferencesSummary,
     UpdateAlertPreferencesRequest
 )
+from ..responses import ORJSONResponse
 from ..services.alert_preferences_service import AlertPreferencesService
 
 # Configure logging
@@ -27,6 +31,21 @@ router = APIRouter(prefix="/api/v1/preferences", tags=["alert-preferences"])
 preferences_service = AlertPreferencesService()
 
 
+def _forget_alerts_enabled(http_request: Request):
+    """
+    Clear the price check's cached "are alerts on?" answer after preferences change.
+    
+    Without this, turning alerts back on would only be noticed by the price
+    check once its cached answer expired.
+    
+    Args:
+        http_request: The incoming request, used to reach the app state
+    """
+    cache = getattr(http_request.app.state, "alerts_enabled_cache", None)
+    if cache is not None:
+        cache.clear()
+
+
 @router.get("/alerts", response_model=AlertPreferencesResponse)
 async def get_alert_preferences():
     """
@@ -48,10 +67,10 @@ async def get_alert_preferences():
                 detail="Alert preferences not found"
             )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
-                "preferences": preferences.model_dump(mode='json') if preferences else None,
+                "preferences": preferences.model_dump() if preferences else None,
                 "message": "Alert preferences retrieved successfully"
             }
         )
@@ -59,7 +78,7 @@ async def get_alert_preferences():
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting alert preferences: {str(e)}")
+        logger.error("Error getting alert preferences: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to retrieve alert preferences: {str(e)}"
@@ -67,7 +86,7 @@ async def get_alert_preferences():
 
 
 @router.put("/alerts", response_model=AlertPreferencesResponse)
-async def update_alert_preferences(request: UpdateAlertPreferencesRequest):
+async def update_alert_preferences(request: UpdateAlertPreferencesRequest, http_request: Request):
     """
     Update alert preferences.
     
@@ -76,6 +95,7 @@ async def update_alert_preferences(request: UpdateAlertPreferencesRequest):
     
     Args:
         request: UpdateAlertPreferencesRequest with updated settings
+        http_request: The incoming HTTP request
         
     Returns:
         Updated alert preferences
@@ -90,10 +110,12 @@ async def update_alert_preferences(request: UpdateAlertPreferencesRequest):
                 detail="Failed to update alert preferences"
             )
         
-        return JSONResponse(
+        _forget_alerts_enabled(http_request)
+        
+        return ORJSONResponse(
             status_code=200,
             content={
-                "preferences": preferences.model_dump(mode='json') if preferences else None,
+                "preferences": preferences.model_dump() if preferences else None,
                 "message": "Alert preferences updated successfully"
             }
         )
@@ -101,7 +123,7 @@ async def update_alert_preferences(request: UpdateAlertPreferencesRequest):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error updating alert preferences: {str(e)}")
+        logger.error("Error updating alert preferences: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to update alert preferences: {str(e)}"
@@ -109,13 +131,16 @@ async def update_alert_preferences(request: UpdateAlertPreferencesRequest):
 
 
 @router.post("/alerts/reset", response_model=AlertPreferencesResponse)
-async def reset_alert_preferences():
+async def reset_alert_preferences(http_request: Request):
     """
     Reset alert preferences to default values.
     
     Resets all alert preferences to their default values.
     This action cannot be undone.
     
+    Args:
+        http_request: The incoming HTTP request
+        
     Returns:
         Alert preferences with default values
     """
@@ -129,10 +154,12 @@ async def reset_alert_preferences():
                 detail="Failed to reset alert preferences"
             )
         
-        return JSONResponse(
+        _forget_alerts_enabled(http_request)
+        
+        return ORJSONResponse(
             status_code=200,
             content={
-                "preferences": preferences.model_dump(mode='json') if preferences else None,
+                "preferences": preferences.model_dump() if preferences else None,
                 "message": "Alert preferences reset to defaults successfully"
             }
         )
@@ -140,7 +167,7 @@ async def reset_alert_preferences():
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error resetting alert preferences: {str(e)}")
+        logger.error("Error resetting alert preferences: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to reset alert preferences: {str(e)}"
@@ -160,18 +187,19 @@ async def get_alert_preferences_summary():
     """
     try:
         logger.info("Getting alert preferences summary")
-        summary = preferences_service.get_preferences_summary()
+        # Pre-rendered JSON bytes, passed through orjson untouched
+        summary_json = preferences_service.get_preferences_summary_json()
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
-                "summary": summary.model_dump(mode='json') if summary else None,
+                "summary": orjson.Fragment(summary_json),
                 "message": "Alert preferences summary retrieved successfully"
             }
         )
         
     except Exception as e:
-        logger.error(f"Error getting alert preferences summary: {str(e)}")
+        logger.error("Error getting alert preferences summary: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to retrieve alert preferences summary: {str(e)}"
@@ -193,10 +221,10 @@ async def get_effective_threshold(stock_symbol: Optional[str] = None):
         Effective alert threshold percentage
     """
     try:
-        logger.info(f"Getting effective threshold for {stock_symbol or 'global'}")
+        logger.info("Getting effective threshold for %s", stock_symbol or 'global')
         threshold = preferences_service.get_effective_threshold(stock_symbol)
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "stock_symbol": stock_symbol,
@@ -206,7 +234,7 @@ async def get_effective_threshold(stock_symbol: Optional[str] = None):
         )
         
     except Exception as e:
-        logger.error(f"Error getting effective threshold: {str(e)}")
+        logger.error("Error getting effective threshold: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to retrieve effective threshold: {str(e)}"
@@ -229,10 +257,10 @@ async def check_alert_eligibility(stock_symbol: str, alert_type: str):
         Whether the alert should be sent
     """
     try:
-        logger.info(f"Checking alert eligibility for {stock_symbol} ({alert_type})")
+        logger.info("Checking alert eligibility for %s (%s)", stock_symbol, alert_type)
         should_send = preferences_service.should_send_alert(stock_symbol, alert_type)
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "stock_symbol": stock_symbol,
@@ -243,7 +271,7 @@ async def check_alert_eligibility(stock_symbol: str, alert_type: str):
         )
         
     except Exception as e:
-        logger.error(f"Error checking alert eligibility: {str(e)}")
+        logger.error("Error checking alert eligibility: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to check alert eligibility: {str(e)}"
@@ -268,10 +296,13 @@ async def get_alert_preferences_service_status():
         summary = preferences_service.get_preferences_summary()
         
         # Check storage file status
-        import os
         storage_file = preferences_service.storage_file
-        file_exists = os.path.exists(storage_file)
-        file_size = os.path.getsize(storage_file) if file_exists else 0
+        try:
+            # One stat call gives us both whether the file exists and its size
+            file_size = os.stat(storage_file).st_size
+            file_exists = True
+        except OSError:
+            file_exists, file_size = False, 0
         
         # Get current preferences
         current_preferences = preferences_service.get_preferences()
@@ -287,10 +318,10 @@ async def get_alert_preferences_service_status():
             "active_preferences": summary.active_preferences,
             "average_threshold": summary.average_threshold,
             "last_updated": summary.last_updated,
-            "timestamp": "2024-01-01T00:00:00Z"
+            "timestamp": int(time.time())
         }
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "status": status,
@@ -299,7 +330,7 @@ async def get_alert_preferences_service_status():
         )
         
     except Exception as e:
-        logger.error(f"Error getting alert preferences service status: {str(e)}")
+        logger.error("Error getting alert preferences service status: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to retrieve alert preferences service status: {str(e)}"
@@ -6,9 +6,9 @@ and retrieving the list of stocks being monitored for price changes.
 """
 
 import logging
+import time
 from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Query, Path
-from fastapi.responses import JSONResponse
 
 from ..models.stock_list import (
     StockListResponse, 
@@ -16,6 +16,7 @@ from ..models.stock_list import (
     AddStockRequest,
     UpdateStockRequest
 )
+from ..responses import ORJSONResponse
 from ..services.stock_list_service import StockListService
 
 # Configure logging
@@ -46,7 +47,7 @@ async def get_tracked_stocks():
         stocks = stock_list_service.get_all_stocks()
         
         return {
-            "stocks": [stock.model_dump(mode='json') for stock in stocks] if stocks else [],
+            "stocks": [stock.model_dump() for stock in stocks] if stocks else [],
             "count": len(stocks) if stocks else 0,
             "message": f"Retrieved {len(stocks)} tracked stocks"
         }
@@ -93,7 +94,7 @@ async def get_tracked_stocks_with_prices():
                 
                 if quote:
                     # Create enhanced stock data with current price
-                    stock_data = stock.model_dump(mode='json')
+                    stock_data = stock.model_dump()
                     stock_data['current_price'] = float(quote.price)
                     stock_data['last_alert'] = None  # TODO: Implement last alert tracking
                     stock_data['price_change'] = float(quote.price) - float(quote.previous_close)
@@ -103,7 +104,7 @@ async def get_tracked_stocks_with_prices():
                     stocks_with_prices.append(stock_data)
                 else:
                     # If we can't get price data, include the stock without price info
-                    stock_data = stock.model_dump(mode='json')
+                    stock_data = stock.model_dump()
                     stock_data['current_price'] = None
                     stock_data['last_alert'] = None
                     stock_data['price_change'] = None
@@ -116,7 +117,7 @@ async def get_tracked_stocks_with_prices():
             except Exception as e:
                 logger.warning(f"Error fetching price for {stock.symbol}: {str(e)}")
                 # Include the stock with error information
-                stock_data = stock.model_dump(mode='json')
+                stock_data = stock.model_dump()
                 stock_data['current_price'] = None
                 stock_data['last_alert'] = None
                 stock_data['price_change'] = None
@@ -153,7 +154,7 @@ async def get_active_stock_symbols():
         logger.info("Getting active stock symbols")
         symbols = stock_list_service.get_active_stocks()
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "symbols": symbols,
@@ -185,10 +186,10 @@ async def get_stock_list_summary():
         logger.info("Getting stock list summary")
         summary = stock_list_service.get_stock_list_summary()
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
-                "summary": summary.model_dump(mode='json') if summary else None,
+                "summary": summary.model_dump() if summary else None,
                 "message": "Stock list summary retrieved successfully"
             }
         )
@@ -227,10 +228,10 @@ async def get_tracked_stock(
                 detail=f"Tracked stock with ID {stock_id} not found"
             )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
-                "stock": stock.model_dump(mode='json') if stock else None,
+                "stock": stock.model_dump() if stock else None,
                 "message": f"Retrieved tracked stock {stock.symbol}"
             }
         )
@@ -269,10 +270,10 @@ async def add_tracked_stock(request: AddStockRequest):
                 detail=f"Failed to add stock {request.symbol}. Stock may already exist or be invalid."
             )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=201,
             content={
-                "stock": stock.model_dump(mode='json') if stock else None,
+                "stock": stock.model_dump() if stock else None,
                 "message": f"Successfully added {stock.symbol} to tracking list"
             }
         )
@@ -315,10 +316,10 @@ async def update_tracked_stock(
                 detail=f"Tracked stock with ID {stock_id} not found"
             )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
-                "stock": stock.model_dump(mode='json') if stock else None,
+                "stock": stock.model_dump() if stock else None,
                 "message": f"Successfully updated {stock.symbol}"
             }
         )
@@ -359,7 +360,7 @@ async def remove_tracked_stock(
                 detail=f"Tracked stock with ID {stock_id} not found"
             )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "message": f"Successfully removed tracked stock with ID {stock_id}",
@@ -410,10 +411,10 @@ async def get_stock_list_service_status():
             "active_stocks": summary.active_stocks,
             "inactive_stocks": summary.inactive_stocks,
             "average_threshold": summary.average_threshold,
-            "timestamp": "2024-01-01T00:00:00Z"
+            "timestamp": int(time.time())
         }
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "status": status,
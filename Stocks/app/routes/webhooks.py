@@ -6,6 +6,7 @@ SMS messages from Twilio webhooks.
 """
 
 import logging
+import time
 from typing import Dict, Any
 from fastapi import APIRouter, Request, HTTPException, Depends
 from fastapi.responses import Response
@@ -323,6 +324,6 @@ async def test_webhook():
     """
     return {
         "message": "Webhook endpoint is working",
-        "timestamp": "2024-01-01T00:00:00Z",
+        "timestamp": int(time.time()),
         "status": "ok"
     }
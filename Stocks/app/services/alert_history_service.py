@@ -5,11 +5,13 @@ This service handles storing alert information when alerts are sent,
 and provides methods to retrieve alert history for the user interface.
 """
 
+import heapq
 import logging
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 import json
 import os
+import time
 
 from ..models.alert_history import AlertHistory, AlertHistoryResponse, AlertHistorySummary
 
@@ -67,7 +69,7 @@ class AlertHistoryService:
         """Save alerts to the storage file."""
         try:
             # Convert alerts to dictionaries for JSON serialization
-            alerts_data = [alert.dict() for alert in self.alerts]
+            alerts_data = [alert.model_dump(mode="json") for alert in self.alerts]
             
             with open(self.storage_file, 'w') as f:
                 json.dump(alerts_data, f, indent=2, default=str)
@@ -117,13 +119,14 @@ class AlertHistoryService:
             List of recent alerts with computed fields
         """
         try:
-            # Sort by timestamp (newest first) and limit results
-            recent_alerts = sorted(self.alerts, key=lambda x: x.timestamp, reverse=True)[:limit]
+            # Pick the newest alerts (same result as sort + slice, without sorting the whole history)
+            recent_alerts = heapq.nlargest(limit, self.alerts, key=lambda x: x.timestamp)
             
             # Convert to response format with computed fields
             response_alerts = []
             for alert in recent_alerts:
-                response_alert = AlertHistoryResponse(
+                # The alert was validated when it was loaded or added
+                response_alert = AlertHistoryResponse.from_row(dict(
                     id=alert.id,
                     symbol=alert.symbol,
                     current_price=alert.current_price,
@@ -137,7 +140,7 @@ class AlertHistoryService:
                     email_sent=alert.email_sent,
                     price_change_dollar=alert.current_price - alert.previous_price,
                     time_ago=self._get_time_ago(alert.timestamp)
-                )
+                ))
                 response_alerts.append(response_alert)
             
             logger.info(f"Retrieved {len(response_alerts)} recent alerts")
@@ -159,17 +162,19 @@ class AlertHistoryService:
             List of alerts for the specified symbol
         """
         try:
-            # Filter by symbol and sort by timestamp
-            symbol_alerts = [
-                alert for alert in self.alerts 
-                if alert.symbol.upper() == symbol.upper()
-            ]
-            symbol_alerts = sorted(symbol_alerts, key=lambda x: x.timestamp, reverse=True)[:limit]
+            # Filter by symbol and keep the newest alerts
+            symbol = symbol.upper()
+            symbol_alerts = heapq.nlargest(
+                limit,
+                (alert for alert in self.alerts if alert.symbol.upper() == symbol),
+                key=lambda x: x.timestamp
+            )
             
             # Convert to response format
             response_alerts = []
             for alert in symbol_alerts:
-                response_alert = AlertHistoryResponse(
+                # The alert was validated when it was loaded or added
+                response_alert = AlertHistoryResponse.from_row(dict(
                     id=alert.id,
                     symbol=alert.symbol,
                     current_price=alert.current_price,
@@ -183,7 +188,7 @@ class AlertHistoryService:
                     email_sent=alert.email_sent,
                     price_change_dollar=alert.current_price - alert.previous_price,
                     time_ago=self._get_time_ago(alert.timestamp)
-                )
+                ))
                 response_alerts.append(response_alert)
             
             logger.info(f"Retrieved {len(response_alerts)} alerts for {symbol}")
@@ -297,3 +302,31 @@ class AlertHistoryService:
         except Exception as e:
             logger.error(f"Error clearing alert history: {str(e)}")
             return False
+    
+    def get_service_status(self) -> Dict[str, Any]:
+        """
+        Get alert history service status information.
+        
+        Returns:
+            Dictionary with storage file status and alert counts
+        """
+        summary = self.get_alert_summary()
+        
+        try:
+            # One stat call gives us both whether the file exists and its size
+            file_size = os.stat(self.storage_file).st_size
+            file_exists = True
+        except OSError:
+            file_exists, file_size = False, 0
+        
+        return {
+            "service": "Alert History Service",
+            "status": "operational",
+            "storage_file": self.storage_file,
+            "file_exists": file_exists,
+            "file_size_bytes": file_size,
+            "total_alerts": summary.total_alerts,
+            "alerts_today": summary.alerts_today,
+            "last_alert_time": summary.last_alert_time,
+            "timestamp": int(time.time())
+        }
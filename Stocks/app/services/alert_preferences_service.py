@@ -6,7 +6,7 @@ for alert thresholds, frequency, types, and other customization options.
 """
 
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 from datetime import datetime, timedelta
 import json
 import os
@@ -17,6 +17,7 @@ from ..models.alert_preferences import (
     AlertPreferencesSummary,
     UpdateAlertPreferencesRequest
 )
+from ..models.stock_list import TrackedStock
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -39,11 +40,15 @@ class AlertPreferencesService:
         """
         self.storage_file = storage_file
         self.preferences: Optional[AlertPreferences] = None
+        self._loaded_mtime: Optional[float] = None
+        self._summary_json: Optional[bytes] = None  # Rendered summary, cleared on load/save
         self._load_preferences()
         logger.info(f"AlertPreferencesService initialized with preferences: {self.preferences is not None}")
     
     def _load_preferences(self):
         """Load existing preferences from the storage file."""
+        self._loaded_mtime = self._storage_mtime()
+        self._summary_json = None
         try:
             if os.path.exists(self.storage_file):
                 with open(self.storage_file, 'r') as f:
@@ -58,9 +63,32 @@ class AlertPreferencesService:
             logger.error(f"Error loading alert preferences: {str(e)}")
             self._initialize_default_preferences()
     
+    def _storage_mtime(self) -> Optional[float]:
+        """Return the storage file's modification time, or None if it doesn't exist."""
+        try:
+            return os.path.getmtime(self.storage_file)
+        except OSError:
+            return None
+    
+    def reload_if_changed(self) -> bool:
+        """
+        Reload preferences if the storage file changed since we last read it.
+        
+        Long-lived instances (like the scheduler's) use this to pick up edits
+        made through the API without re-reading the file on every call.
+        
+        Returns:
+            True if the file was reloaded, False otherwise
+        """
+        if self._storage_mtime() == self._loaded_mtime:
+            return False
+        self._load_preferences()
+        return True
+    
     def _initialize_default_preferences(self):
         """Initialize with default alert preferences."""
-        self.preferences = AlertPreferences(
+        now = datetime.utcnow()
+        self.preferences = AlertPreferences.from_row(dict(
             id=1,
             global_alert_threshold=1.0,  # Updated to 1.0% default
             alert_frequency="MARKET_HOURS",
@@ -79,14 +107,15 @@ class AlertPreferencesService:
             enable_news_alerts=True,
             news_sentiment_threshold=0.7,
             custom_schedule=None,
-            created_date=datetime.utcnow(),
-            updated_date=datetime.utcnow(),
+            created_date=now,
+            updated_date=now,
             is_active=True
-        )
+        ))
         self._save_preferences()
     
     def _save_preferences(self):
         """Save preferences to the storage file."""
+        self._summary_json = None
         try:
             if self.preferences:
                 preferences_data = self.preferences.model_dump()
@@ -116,32 +145,14 @@ class AlertPreferencesService:
             alerts_sent_today = self._get_alerts_sent_today()
             cooldown_active = self._is_cooldown_active()
             
-            response = AlertPreferencesResponse(
-                id=self.preferences.id,
-                global_alert_threshold=self.preferences.global_alert_threshold,
-                alert_frequency=self.preferences.alert_frequency,
-                market_hours_only=self.preferences.market_hours_only,
-                # Removed alert_types field as it's no longer in the model
-                email_alerts_enabled=self.preferences.email_alerts_enabled,
-                email_rich_format=self.preferences.email_rich_format,
-                sms_alerts_enabled=self.preferences.sms_alerts_enabled,
-                include_analysis=self.preferences.include_analysis,
-                include_key_factors=self.preferences.include_key_factors,
-                include_price_history=self.preferences.include_price_history,
-                max_alerts_per_day=self.preferences.max_alerts_per_day,
-                alert_cooldown_minutes=self.preferences.alert_cooldown_minutes,
-                enable_volume_alerts=self.preferences.enable_volume_alerts,
-                volume_threshold_multiplier=self.preferences.volume_threshold_multiplier,
-                enable_news_alerts=self.preferences.enable_news_alerts,
-                news_sentiment_threshold=self.preferences.news_sentiment_threshold,
-                custom_schedule=self.preferences.custom_schedule,
-                created_date=self.preferences.created_date.isoformat() if isinstance(self.preferences.created_date, datetime) else self.preferences.created_date,
-                updated_date=self.preferences.updated_date.isoformat() if isinstance(self.preferences.updated_date, datetime) else self.preferences.updated_date,
-                is_active=self.preferences.is_active,
-                next_alert_time=next_alert_time.isoformat() if isinstance(next_alert_time, datetime) else next_alert_time,
+            # Built from preferences we already validated, so skip re-validation.
+            # The response has every preferences field plus the computed ones.
+            response = AlertPreferencesResponse.from_row(dict(
+                self.preferences,
+                next_alert_time=next_alert_time,
                 alerts_sent_today=alerts_sent_today,
                 cooldown_active=cooldown_active
-            )
+            ))
             
             logger.info("Retrieved alert preferences with computed fields")
             return response
@@ -166,7 +177,7 @@ class AlertPreferencesService:
                 return None
             
             # Update fields if provided
-            update_data = request.dict(exclude_unset=True)
+            update_data = request.model_dump(exclude_unset=True)
             
             for field, value in update_data.items():
                 if hasattr(self.preferences, field):
@@ -247,6 +258,20 @@ class AlertPreferencesService:
                 last_updated=None
             )
     
+    def get_preferences_summary_json(self) -> bytes:
+        """
+        Get the preferences summary already rendered as JSON.
+        
+        The summary only changes when preferences are loaded or saved, so the
+        rendered bytes are kept and reused until one of those happens.
+        
+        Returns:
+            JSON bytes of the AlertPreferencesSummary
+        """
+        if self._summary_json is None:
+            self._summary_json = self.get_preferences_summary().model_dump_json().encode()
+        return self._summary_json
+    
     def _calculate_next_alert_time(self) -> Optional[datetime]:
         """
         Calculate when the next alert is scheduled.
@@ -356,6 +381,65 @@ class AlertPreferencesService:
             logger.error(f"Error getting effective threshold: {str(e)}")
             return 1.0
     
+    def get_effective_thresholds(
+        self,
+        stock_symbols: List[str],
+        tracked_stocks: List[TrackedStock]
+    ) -> Dict[str, float]:
+        """
+        Get the effective alert threshold for several stocks at once.
+        
+        Same rules as get_effective_threshold, but uses the tracked stocks the
+        caller already has (e.g., the long-lived StockListService on app.state)
+        instead of loading the stock list again.
+        
+        Args:
+            stock_symbols: Stock symbols to get thresholds for
+            tracked_stocks: Tracked stocks holding the per-stock thresholds
+            
+        Returns:
+            Dictionary mapping each symbol to its effective threshold percentage
+        """
+        if not self.preferences:
+            return {symbol: 3.0 for symbol in stock_symbols}  # Default threshold
+        
+        global_threshold = self.preferences.global_alert_threshold
+        individual_thresholds = {}
+        
+        for stock in tracked_stocks:
+            individual_thresholds.setdefault(stock.symbol.upper(), stock.alert_threshold)
+        
+        return {
+            symbol: individual_thresholds.get(symbol.upper(), global_threshold)
+            for symbol in stock_symbols
+        }
+    
+    def get_enabled_symbols(self, stock_symbols: List[str]) -> Set[str]:
+        """
+        Get the stocks that alerts may currently be sent for.
+        
+        Same rules as should_send_alert, evaluated once for the whole batch.
+        
+        Args:
+            stock_symbols: Stock symbols to check
+            
+        Returns:
+            Set of symbols that alerts can be sent for
+        """
+        try:
+            if not self.preferences or not self.preferences.is_active:
+                return set()
+            
+            # Check if email alerts are enabled
+            if not self.preferences.email_alerts_enabled:
+                return set()
+            
+            return set(stock_symbols)
+            
+        except Exception as e:
+            logger.error(f"Error checking which alerts should be sent: {str(e)}")
+            return set()
+    
     def should_send_alert(self, stock_symbol: str) -> bool:
         """
         Check if an alert should be sent based on preferences.
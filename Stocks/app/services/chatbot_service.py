@@ -38,6 +38,19 @@ from ..models.config import settings  # App configuration
 # Set up logging for this file
 logger = logging.getLogger(__name__)
 
+# Regex patterns for the fallback command parser, compiled once at import.
+# Add new patterns here rather than compiling them inside a function.
+# Order matters: the first command pattern that matches wins.
+_COMMAND_PATTERNS = (
+    ("add", re.compile(r'\b(add|track|watch)\b')),
+    ("remove", re.compile(r'\b(remove|delete|stop)\b')),
+    ("list", re.compile(r'\b(list|show|display)\b')),
+    ("status", re.compile(r'\b(status|health)\b')),
+    ("help", re.compile(r'\b(help|commands)\b')),
+)
+_SYMBOL_SEARCH_RE = re.compile(r'\b([A-Z]{1,5})\b')
+_SYMBOL_FORMAT_RE = re.compile(r'^[A-Z]{1,5}$')
+
 
 class CommandOutput(BaseModel):
     """
@@ -109,20 +122,15 @@ class CommandOutputParser(BaseOutputParser):
         """
         # Extract command type
         command_type = "help"
-        if re.search(r'\b(add|track|watch)\b', text.lower()):
-            command_type = "add"
-        elif re.search(r'\b(remove|delete|stop)\b', text.lower()):
-            command_type = "remove"
-        elif re.search(r'\b(list|show|display)\b', text.lower()):
-            command_type = "list"
-        elif re.search(r'\b(status|health)\b', text.lower()):
-            command_type = "status"
-        elif re.search(r'\b(help|commands)\b', text.lower()):
-            command_type = "help"
+        lowered = text.lower()
+        for name, pattern in _COMMAND_PATTERNS:
+            if pattern.search(lowered):
+                command_type = name
+                break
         
         # Extract symbol
         symbol = None
-        symbol_match = re.search(r'\b([A-Z]{1,5})\b', text.upper())
+        symbol_match = _SYMBOL_SEARCH_RE.search(text.upper())
         if symbol_match:
             symbol = symbol_match.group(1)
         
@@ -320,7 +328,7 @@ Examples:
         
         # Validate symbol format
         if command.symbol:
-            if not re.match(r'^[A-Z]{1,5}$', command.symbol):
+            if not _SYMBOL_FORMAT_RE.match(command.symbol):
                 validation_result["is_valid"] = False
                 validation_result["errors"].append(f"Invalid stock symbol format: {command.symbol}")
         
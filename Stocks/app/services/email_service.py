@@ -18,6 +18,7 @@ import smtplib
 import logging
 import os
 import requests
+import httpx
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
@@ -66,8 +67,16 @@ class EmailService:
     2. Mock mode: Logs emails to console (for testing)
     """
     
-    def __init__(self):
-        """Initialize the email service with configuration"""
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        """
+        Initialize the email service with configuration
+        
+        Args:
+            http_client: Shared connection-pooled client for Mailgun requests.
+                If not given, each email is sent with a one-off requests call.
+        """
+        self.http_client = http_client
+        
         # Mailgun API credentials
         self.mailgun_api_key = os.getenv('MAILGUN_API_KEY')
         self.mailgun_domain = os.getenv('MAILGUN_DOMAIN')
@@ -298,17 +307,21 @@ class EmailService:
                 mailgun_url = f"https://api.mailgun.net/v3/{self.mailgun_domain}/messages"
                 
                 # Send email using Mailgun API (sandbox format)
-                response = requests.post(
-                    mailgun_url,
-                    auth=("api", self.mailgun_api_key),
-                    data={
+                mailgun_request = {
+                    "auth": ("api", self.mailgun_api_key),
+                    "data": {
                         "from": f"Stock Alert System <{self.from_email}>",
                         "to": f"Ben Hannan <{email_msg.to_email}>",
                         "subject": email_msg.subject,
                         "html": email_msg.html_content,
                         "text": email_msg.text_content
                     }
-                )
+                }
+                if self.http_client is not None:
+                    # Reuses the app's pooled connection instead of a new TLS handshake
+                    response = await self.http_client.post(mailgun_url, **mailgun_request)
+                else:
+                    response = requests.post(mailgun_url, **mailgun_request)
                 
                 if response.status_code == 200:
                     logger.info(f"Email sent successfully via Mailgun to {email_msg.to_email}")
@@ -75,20 +75,22 @@ class MockSMSService:
         try:
             logger.info(f"📱 MOCK SMS SENT to {to_number}: {message[:50]}...")
             
-            # Create mock SMS record
+            # Create mock SMS record (one timestamp for every time field)
+            now = datetime.utcnow()
             sms_record = SMSMessage(
                 from_number=self.from_number,
                 to_number=to_number,
                 body=message,
                 status="sent",
                 direction="outbound",
-                twilio_sid=f"MOCK_{datetime.utcnow().timestamp()}",
-                sent_at=datetime.utcnow()
+                twilio_sid=f"MOCK_{now.timestamp()}",
+                created_at=now,
+                sent_at=now
             )
             
             # Store in message history
             self.message_history.append({
-                "timestamp": datetime.utcnow(),
+                "timestamp": now,
                 "to": to_number,
                 "message": message,
                 "type": message_type
@@ -16,7 +16,7 @@ from apscheduler.triggers.cron import CronTrigger
 from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.executors.asyncio import AsyncIOExecutor
 
-from ..models.config import SchedulerConfig, settings
+from ..models.config import ALERT_THRESHOLD_PERCENT, CHECK_INTERVAL_MINUTES, settings
 from ..models.stock import Stock, StockAlert
 
 # Configure logging
@@ -230,7 +230,7 @@ class SchedulerService:
                     logger.info(f"Scheduled market hours job: {job_id} at {time['hour']:02d}:{time['minute']:02d} UTC Monday through Friday")
             else:
                 # Fallback to interval-based scheduling
-                check_interval = SchedulerConfig.get_check_interval()
+                check_interval = CHECK_INTERVAL_MINUTES
                 self.scheduler.add_job(
                     func=self._execute_stock_check,
                     trigger=IntervalTrigger(minutes=check_interval),
@@ -494,8 +494,8 @@ class SchedulerService:
                 'check_count': self._check_count,
                 'scheduled_tasks': len(self.scheduler.get_jobs()),
                 'registered_callbacks': len(self._task_callbacks),
-                'check_interval_minutes': SchedulerConfig.get_check_interval(),
-                'alert_threshold_percent': SchedulerConfig.get_alert_threshold(),
+                'check_interval_minutes': CHECK_INTERVAL_MINUTES,
+                'alert_threshold_percent': ALERT_THRESHOLD_PERCENT,
                 'timestamp': datetime.utcnow().isoformat()
             }
         except Exception as e:
@@ -13,7 +13,12 @@ from twilio.rest import Client
 from twilio.base.exceptions import TwilioException
 
 from ..models.sms import SMSMessage, SMSResponse, SMSAlert, TwilioWebhook
-from ..models.config import TwilioConfig
+from ..models.config import (
+    TWILIO_ACCOUNT_SID,
+    TWILIO_AUTH_TOKEN,
+    TWILIO_PHONE_NUMBER,
+    USER_PHONE_NUMBER,
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -30,12 +35,9 @@ class SMSService:
     def __init__(self):
         """Initialize the SMS service with Twilio client."""
         try:
-            self.client = Client(
-                TwilioConfig.get_account_sid(),
-                TwilioConfig.get_auth_token()
-            )
-            self.from_number = TwilioConfig.get_phone_number()
-            self.user_phone = TwilioConfig.get_user_phone()
+            self.client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
+            self.from_number = TWILIO_PHONE_NUMBER
+            self.user_phone = USER_PHONE_NUMBER
             logger.info("SMS service initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize SMS service: {str(e)}")
@@ -67,16 +69,18 @@ class SMSService:
                 to=to_number
             )
             
-            # Create SMSMessage record
-            sms_record = SMSMessage(
+            # Create SMSMessage record (one timestamp for both time fields)
+            now = datetime.utcnow()
+            sms_record = SMSMessage.from_row(dict(
                 from_number=self.from_number,
                 to_number=to_number,
                 body=message,
                 status="sent",
                 direction="outbound",
                 twilio_sid=twilio_message.sid,
-                sent_at=datetime.utcnow()
-            )
+                created_at=now,
+                sent_at=now
+            ))
             
             logger.info(f"SMS sent successfully. SID: {twilio_message.sid}")
             return sms_record
@@ -84,7 +88,7 @@ class SMSService:
         except TwilioException as e:
             logger.error(f"Twilio error sending SMS: {str(e)}")
             # Create failed SMS record
-            failed_sms = SMSMessage(
+            failed_sms = SMSMessage.from_row(dict(
                 from_number=self.from_number,
                 to_number=to_number,
                 body=message,
@@ -92,7 +96,7 @@ class SMSService:
                 direction="outbound",
                 error_code=str(e.code) if hasattr(e, 'code') else None,
                 error_message=str(e)
-            )
+            ))
             return failed_sms
         except Exception as e:
             logger.error(f"Unexpected error sending SMS: {str(e)}")
@@ -13,6 +13,7 @@ import os
 
 from ..models.stock_list import (
     TrackedStock, 
+    TRACKED_STOCK_LIST,
     StockListResponse, 
     StockListSummary,
     AddStockRequest,
@@ -46,16 +47,17 @@ class StockListService:
         self.storage_file = storage_file
         self.tracked_stocks: List[TrackedStock] = []
         self.stock_service = StockService()
+        self._loaded_mtime: Optional[float] = None
         self._load_stocks()
         logger.info(f"StockListService initialized with {len(self.tracked_stocks)} tracked stocks")
     
     def _load_stocks(self):
         """Load existing tracked stocks from the storage file."""
+        self._loaded_mtime = self._storage_mtime()
         try:
             if os.path.exists(self.storage_file):
-                with open(self.storage_file, 'r') as f:
-                    data = json.load(f)
-                    self.tracked_stocks = [TrackedStock(**stock) for stock in data]
+                with open(self.storage_file, 'rb') as f:
+                    self.tracked_stocks = TRACKED_STOCK_LIST.validate_json(f.read())
                 logger.info(f"Loaded {len(self.tracked_stocks)} tracked stocks from {self.storage_file}")
             else:
                 # Initialize with default stocks if no file exists
@@ -65,6 +67,28 @@ class StockListService:
             logger.error(f"Error loading tracked stocks: {str(e)}")
             self._initialize_default_stocks()
     
+    def _storage_mtime(self) -> Optional[float]:
+        """Return the storage file's modification time, or None if it doesn't exist."""
+        try:
+            return os.path.getmtime(self.storage_file)
+        except OSError:
+            return None
+    
+    def reload_if_changed(self) -> bool:
+        """
+        Reload tracked stocks if the storage file changed since we last read it.
+        
+        Long-lived instances (like the scheduler's) use this to pick up edits
+        made through the API without re-reading the file on every call.
+        
+        Returns:
+            True if the file was reloaded, False otherwise
+        """
+        if self._storage_mtime() == self._loaded_mtime:
+            return False
+        self._load_stocks()
+        return True
+    
     def _initialize_default_stocks(self):
         """Initialize with default tracked stocks."""
         default_stocks = [
@@ -111,33 +135,20 @@ class StockListService:
             response_stocks = []
             
             for stock in self.tracked_stocks:
-                # Calculate days tracked
-                # Handle both datetime and string formats for added_date
-                if isinstance(stock.added_date, str):
-                    try:
-                        added_date = datetime.fromisoformat(stock.added_date.replace('Z', '+00:00'))
-                    except ValueError:
-                        added_date = datetime.utcnow()
-                else:
-                    added_date = stock.added_date
-                
-                days_tracked = (datetime.utcnow() - added_date).days
-                
                 # Note: Current price is now fetched on-demand in the web interface
                 # This avoids persistence issues and ensures fresh data
                 
-                # Create response object
-                response_stock = StockListResponse(
+                # Create response object (the stock was validated when loaded)
+                response_stock = StockListResponse.from_row(dict(
                     id=stock.id,
                     symbol=stock.symbol,
                     name=stock.name,
-                    added_date=stock.added_date.isoformat() if isinstance(stock.added_date, datetime) else stock.added_date,
+                    added_date=stock.added_date,
                     is_active=stock.is_active,
                     alert_threshold=stock.alert_threshold,
                     notes=stock.notes,
-                    days_tracked=days_tracked,
                     # Note: current_price and last_alert are now fetched on-demand
-                )
+                ))
                 
                 response_stocks.append(response_stock)
             
@@ -184,12 +195,9 @@ class StockListService:
                 logger.warning(f"Stock with ID {stock_id} not found")
                 return None
             
-            # Calculate days tracked
-            days_tracked = (datetime.utcnow() - stock.added_date).days
-            
             # Note: Current price is now fetched on-demand in the web interface
             
-            response_stock = StockListResponse(
+            response_stock = StockListResponse.from_row(dict(
                 id=stock.id,
                 symbol=stock.symbol,
                 name=stock.name,
@@ -197,10 +205,8 @@ class StockListService:
                 is_active=stock.is_active,
                 alert_threshold=stock.alert_threshold,
                 notes=stock.notes,
-                days_tracked=days_tracked,
-                current_price=current_price,
-                last_alert=None  # TODO: Get from alert history
-            )
+                # Note: current_price and last_alert are now fetched on-demand
+            ))
             
             logger.info(f"Retrieved stock {stock.symbol} (ID: {stock_id})")
             return response_stock
@@ -276,18 +282,16 @@ class StockListService:
             logger.info(f"Added stock {symbol} to tracking list (ID: {new_stock.id})")
             
             # Return response object
-            return StockListResponse(
+            return StockListResponse.from_row(dict(
                 id=new_stock.id,
                 symbol=new_stock.symbol,
                 name=new_stock.name,
                 added_date=new_stock.added_date,
                 is_active=new_stock.is_active,
                 alert_threshold=new_stock.alert_threshold,
-                alert_type=new_stock.alert_type,
                 notes=new_stock.notes,
-                days_tracked=0,
                 # Note: current_price and last_alert are now fetched on-demand
-            )
+            ))
             
         except Exception as e:
             logger.error(f"Error adding stock {request.symbol}: {str(e)}")
@@ -327,9 +331,7 @@ class StockListService:
             logger.info(f"Updated stock {stock.symbol} (ID: {stock_id})")
             
             # Return updated response object
-            days_tracked = (datetime.utcnow() - stock.added_date).days
-            
-            return StockListResponse(
+            return StockListResponse.from_row(dict(
                 id=stock.id,
                 symbol=stock.symbol,
                 name=stock.name,
@@ -337,9 +339,8 @@ class StockListService:
                 is_active=stock.is_active,
                 alert_threshold=stock.alert_threshold,
                 notes=stock.notes,
-                days_tracked=days_tracked,
                 # Note: current_price and last_alert are now fetched on-demand
-            )
+            ))
             
         except Exception as e:
             logger.error(f"Error updating stock {stock_id}: {str(e)}")
@@ -401,13 +402,13 @@ class StockListService:
                 total_threshold = sum(stock.alert_threshold for stock in self.tracked_stocks)
                 average_threshold = total_threshold / len(self.tracked_stocks)
             
-            summary = StockListSummary(
+            summary = StockListSummary.from_row(dict(
                 total_stocks=total_stocks,
                 active_stocks=active_stocks,
                 inactive_stocks=inactive_stocks,
                 most_recent_addition=most_recent_addition,
                 average_threshold=average_threshold
-            )
+            ))
             
             logger.info(f"Generated stock list summary: {total_stocks} total, {active_stocks} active")
             return summary
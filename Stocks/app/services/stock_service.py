@@ -19,11 +19,13 @@ from typing import List, Optional, Dict, Any  # For type hints
 from datetime import datetime, timedelta  # For working with dates and times
 from decimal import Decimal  # For precise financial calculations
 import asyncio  # For handling multiple operations at once
+from collections import defaultdict  # For creating per-symbol locks on demand
 from dataclasses import dataclass  # For creating simple data containers
 
 # Third-party imports
 import yfinance as yf  # Yahoo Finance library for stock data
 import aiohttp  # For making HTTP requests asynchronously
+from cachetools import TTLCache  # Size-bounded cache whose entries expire on their own
 
 # Our custom imports
 from ..models.stock import Stock, StockPrice, StockAlert  # Our stock data models
@@ -32,6 +34,9 @@ from ..models.config import settings  # App configuration
 # Set up logging for this file
 logger = logging.getLogger(__name__)
 
+# How many single-symbol lookups may run at once when the batch download misses some
+FALLBACK_QUOTE_CONCURRENCY = 10
+
 
 @dataclass
 class StockQuote:
@@ -83,8 +88,12 @@ class StockService:
     def __init__(self):
         """Initialize the stock service."""
         self.session = None
-        self._cache = {}
-        self._cache_ttl = 300  # 5 minutes cache TTL
+        self._cache_ttl = 60  # Intraday quotes go stale quickly, so keep them for 1 minute
+        self._cache = TTLCache(maxsize=512, ttl=self._cache_ttl)
+        # One lock per symbol so concurrent misses for the same stock share one fetch
+        self._symbol_locks = defaultdict(asyncio.Lock)
+        self._cache_hits = 0
+        self._cache_misses = 0
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -118,50 +127,219 @@ class StockService:
             
             # Check cache first
             cache_key = f"quote_{symbol}"
-            if cache_key in self._cache:
-                cached_data, timestamp = self._cache[cache_key]
-                if datetime.utcnow() - timestamp < timedelta(seconds=self._cache_ttl):
-                    logger.debug(f"Returning cached quote for {symbol}")
-                    return cached_data
-            
-            # Fetch from yfinance
-            logger.info(f"Fetching quote for {symbol}")
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
+            cached_quote = self._get_cached_quote(cache_key)
+            if cached_quote is not None:
+                logger.debug(f"Returning cached quote for {symbol}")
+                return cached_quote
+            
+            async with self._symbol_locks[symbol]:
+                # Another request may have filled the cache while we waited
+                cached_quote = self._get_cached_quote(cache_key, count=False)
+                if cached_quote is not None:
+                    return cached_quote
+                
+                # Fetch from yfinance (in a thread so we don't block the event loop)
+                logger.info(f"Fetching quote for {symbol}")
+                ticker = yf.Ticker(symbol)
+                info = await asyncio.to_thread(lambda: ticker.info)
+                
+                # Validate that we got valid data
+                if not info or 'regularMarketPrice' not in info:
+                    logger.warning(f"No price data available for {symbol}")
+                    return None
+                
+                # Extract price data
+                current_price = Decimal(str(info.get('regularMarketPrice', 0)))
+                previous_close = Decimal(str(info.get('previousClose', current_price)))
+                change = current_price - previous_close
+                change_percent = (change / previous_close * 100) if previous_close > 0 else Decimal('0')
+                
+                quote = StockQuote(
+                    symbol=symbol,
+                    price=current_price,
+                    change=change,
+                    change_percent=change_percent,
+                    volume=info.get('volume', 0),
+                    high=Decimal(str(info.get('dayHigh', current_price))),
+                    low=Decimal(str(info.get('dayLow', current_price))),
+                    open_price=Decimal(str(info.get('open', current_price))),
+                    previous_close=previous_close,
+                    timestamp=datetime.utcnow()
+                )
+                
+                # Cache the result
+                self._cache[cache_key] = quote
+            
+            logger.info(f"Successfully fetched quote for {symbol}: ${current_price}")
+            return quote
+            
+        except Exception as e:
+            logger.error(f"Error fetching quote for {symbol}: {str(e)}")
+            raise
+    
+    async def get_stock_quotes(self, symbols: List[str]) -> Dict[str, Optional[StockQuote]]:
+        """
+        Get quotes for many symbols with a single batched Yahoo Finance request.
+        
+        Cached quotes are returned as-is. The remaining symbols are fetched in
+        one yf.download call, and anything the batch couldn't price falls back
+        to get_stock_quote for that symbol, a few symbols at a time.
+        
+        Args:
+            symbols: List of stock symbols
+            
+        Returns:
+            Dictionary mapping each requested symbol to a StockQuote, or None
+            if no data was available
+        """
+        results: Dict[str, Optional[StockQuote]] = {}
+        to_fetch = []
+        
+        for symbol in symbols:
+            cached_quote = self._get_cached_quote(f"quote_{symbol.upper().strip()}")
+            if cached_quote is not None:
+                results[symbol] = cached_quote
+            else:
+                to_fetch.append(symbol)
+        
+        if to_fetch:
+            logger.info(f"Batch fetching quotes for {len(to_fetch)} symbols")
+            try:
+                batch = await asyncio.to_thread(self._download_quotes, to_fetch)
+            except Exception as e:
+                logger.error(f"Batch quote download failed: {str(e)}")
+                batch = {}
+            
+            missed = []
+            for symbol in to_fetch:
+                quote = batch.get(symbol)
+                if quote is None:
+                    missed.append(symbol)
+                else:
+                    self._cache[f"quote_{quote.symbol}"] = quote
+                    results[symbol] = quote
+            
+            if missed:
+                # Fall back to single-symbol lookups for anything the batch missed,
+                # running a bounded number of them at the same time
+                logger.info(f"Fetching {len(missed)} symbols the batch could not price")
+                semaphore = asyncio.Semaphore(FALLBACK_QUOTE_CONCURRENCY)
+                fallback_quotes = await asyncio.gather(
+                    *(self._fetch_fallback_quote(symbol, semaphore) for symbol in missed)
+                )
+                results.update(zip(missed, fallback_quotes))
+        
+        return {symbol: results.get(symbol) for symbol in symbols}
+    
+    async def _fetch_fallback_quote(self, symbol: str, semaphore: asyncio.Semaphore) -> Optional[StockQuote]:
+        """
+        Fetch one symbol the batch download couldn't price.
+        
+        Args:
+            symbol: Stock symbol
+            semaphore: Limits how many lookups run at the same time
             
-            # Validate that we got valid data
-            if not info or 'regularMarketPrice' not in info:
-                logger.warning(f"No price data available for {symbol}")
+        Returns:
+            StockQuote, or None if the lookup failed
+        """
+        async with semaphore:
+            try:
+                return await self.get_stock_quote(symbol)
+            except Exception as e:
+                logger.error(f"Failed to fetch quote for {symbol}: {str(e)}")
                 return None
+    
+    def _download_quotes(self, symbols: List[str]) -> Dict[str, StockQuote]:
+        """
+        Download the last two daily bars for several symbols in one request.
+        
+        This is blocking and is meant to be run in a worker thread.
+        
+        Args:
+            symbols: List of stock symbols
+            
+        Returns:
+            Dictionary of the symbols that could be priced
+        """
+        tickers = [symbol.upper().strip() for symbol in symbols]
+        data = yf.download(
+            tickers=" ".join(tickers),
+            period="2d",
+            group_by="ticker",
+            auto_adjust=False,
+            progress=False,
+            threads=True,
+        )
+        if data is None or data.empty:
+            return {}
+        
+        quotes = {}
+        for symbol, ticker in zip(symbols, tickers):
+            try:
+                frame = data[ticker] if ticker in data.columns.get_level_values(0) else None
+            except Exception:
+                frame = None
+            if frame is None:
+                continue
+            
+            frame = frame.dropna(subset=["Close"])
+            if frame.empty:
+                continue
             
-            # Extract price data
-            current_price = Decimal(str(info.get('regularMarketPrice', 0)))
-            previous_close = Decimal(str(info.get('previousClose', current_price)))
+            last = frame.iloc[-1]
+            current_price = Decimal(str(last["Close"]))
+            previous_close = Decimal(str(frame.iloc[-2]["Close"])) if len(frame) > 1 else current_price
             change = current_price - previous_close
             change_percent = (change / previous_close * 100) if previous_close > 0 else Decimal('0')
             
-            quote = StockQuote(
-                symbol=symbol,
+            quotes[symbol] = StockQuote(
+                symbol=ticker,
                 price=current_price,
                 change=change,
                 change_percent=change_percent,
-                volume=info.get('volume', 0),
-                high=Decimal(str(info.get('dayHigh', current_price))),
-                low=Decimal(str(info.get('dayLow', current_price))),
-                open_price=Decimal(str(info.get('open', current_price))),
+                volume=int(last["Volume"]) if last["Volume"] == last["Volume"] else 0,
+                high=self._price_or_default(last["High"], current_price),
+                low=self._price_or_default(last["Low"], current_price),
+                open_price=self._price_or_default(last["Open"], current_price),
                 previous_close=previous_close,
                 timestamp=datetime.utcnow()
             )
+        
+        return quotes
+    
+    @staticmethod
+    def _price_or_default(value: Any, default: Decimal) -> Decimal:
+        """
+        Convert a downloaded price to Decimal, using a default for missing values.
+        
+        Args:
+            value: Price from the downloaded frame (may be NaN)
+            default: Price to use when the value is missing
             
-            # Cache the result
-            self._cache[cache_key] = (quote, datetime.utcnow())
-            
-            logger.info(f"Successfully fetched quote for {symbol}: ${current_price}")
-            return quote
+        Returns:
+            The price as a Decimal
+        """
+        # NaN is the only value that isn't equal to itself
+        return Decimal(str(value)) if value == value else default
+    
+    def _get_cached_quote(self, cache_key: str, count: bool = True) -> Optional[StockQuote]:
+        """
+        Look up a quote in the cache and record whether it was a hit or a miss.
+        
+        Args:
+            cache_key: Cache key for the quote (e.g., "quote_AAPL")
+            count: Whether to update the hit/miss counters
             
-        except Exception as e:
-            logger.error(f"Error fetching quote for {symbol}: {str(e)}")
-            raise
+        Returns:
+            The cached StockQuote, or None if it isn't cached
+        """
+        cached = self._cache.get(cache_key)
+        if count:
+            if cached is None:
+                self._cache_misses += 1
+            else:
+                self._cache_hits += 1
+        return cached
     
     async def get_multiple_quotes(self, symbols: List[str]) -> Dict[str, Optional[StockQuote]]:
         """
@@ -398,22 +576,16 @@ class StockService:
         """
         Get cache statistics.
         
+        The TTLCache drops expired quotes on its own, so every entry it
+        reports is still fresh.
+        
         Returns:
             Dictionary with cache statistics
         """
-        now = datetime.utcnow()
-        valid_entries = 0
-        expired_entries = 0
-        
-        for key, (_, timestamp) in self._cache.items():
-            if now - timestamp < timedelta(seconds=self._cache_ttl):
-                valid_entries += 1
-            else:
-                expired_entries += 1
-        
         return {
             'total_entries': len(self._cache),
-            'valid_entries': valid_entries,
-            'expired_entries': expired_entries,
-            'cache_ttl_seconds': self._cache_ttl
+            'max_entries': self._cache.maxsize,
+            'cache_ttl_seconds': self._cache_ttl,
+            'cache_hits': self._cache_hits,
+            'cache_misses': self._cache_misses
         }
@@ -17,4 +17,5 @@ pip install -r requirements-prod.txt
 echo "🌟 Starting FastAPI application..."
 # Use Railway's PORT if available, otherwise default to 8000
 PORT=${PORT:-8000}
-uvicorn app.main:app --host 0.0.0.0 --port $PORT --workers 1
+# One worker on purpose: every worker runs its own scheduler (see README "Scaling")
+uvicorn app.main:app --host 0.0.0.0 --port $PORT --workers 1 --loop uvloop --http httptools
@@ -0,0 +1,112 @@
+"""
+Unit tests for the alert history API routes.
+
+This module contains tests for the short-lived response caches on the
+alert history endpoints.
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.models.alert_history import AlertHistory
+from app.routes import alert_history as alert_history_routes
+from app.routes.alert_history import alert_history_service
+
+
+def make_alert(symbol: str = "AAPL") -> AlertHistory:
+    """Create an AlertHistory record for testing."""
+    return AlertHistory(
+        symbol=symbol,
+        current_price=110.0,
+        previous_price=100.0,
+        change_percent=10.0,
+        alert_type="INTRADAY",
+        analysis="Test analysis",
+        key_factors=["Test factor"],
+        timestamp=datetime.utcnow(),
+        threshold_used=3.0
+    )
+
+
+class TestAlertHistoryCache:
+    """Test cases for the alert history response caches."""
+
+    @pytest.fixture
+    def client(self, tmp_path):
+        """
+        Create a client for the alert history router.
+
+        The shared service is pointed at a temporary file with one alert, so
+        the tests never touch the real alert_history.json.
+        """
+        saved_file = alert_history_service.storage_file
+        saved_alerts = alert_history_service.alerts
+        alert_history_service.storage_file = str(tmp_path / "alert_history.json")
+        alert_history_service.alerts = []
+        alert_history_service.add_alert(make_alert())
+        self._clear_caches()
+
+        app = FastAPI()
+        app.include_router(alert_history_routes.router)
+        yield TestClient(app)
+
+        alert_history_service.storage_file = saved_file
+        alert_history_service.alerts = saved_alerts
+        self._clear_caches()
+
+    @staticmethod
+    def _clear_caches():
+        """Empty all alert history response caches."""
+        alert_history_routes._history_cache.clear()
+        alert_history_routes._summary_cache.clear()
+        alert_history_routes._status_cache.clear()
+
+    def test_repeat_request_is_served_from_cache(self, client):
+        """Test that an unchanged history is not rebuilt on the next request."""
+        first = client.get("/api/v1/alerts/history")
+
+        with patch.object(alert_history_service, "get_recent_alerts") as mock_recent:
+            second = client.get("/api/v1/alerts/history")
+
+        mock_recent.assert_not_called()
+        assert second.status_code == 200
+        assert second.content == first.content
+
+    def test_new_alert_bypasses_cache(self, client):
+        """Test that a newly added alert shows up right away."""
+        assert client.get("/api/v1/alerts/history").json()["count"] == 1
+        assert client.get("/api/v1/alerts/history/MSFT").json()["count"] == 0
+        assert client.get("/api/v1/alerts/summary").json()["summary"]["total_alerts"] == 1
+        assert client.get("/api/v1/alerts/status").json()["status"]["total_alerts"] == 1
+
+        alert_history_service.add_alert(make_alert("MSFT"))
+
+        assert client.get("/api/v1/alerts/history").json()["count"] == 2
+        assert client.get("/api/v1/alerts/history/MSFT").json()["count"] == 1
+        assert client.get("/api/v1/alerts/summary").json()["summary"]["total_alerts"] == 2
+        assert client.get("/api/v1/alerts/status").json()["status"]["total_alerts"] == 2
+
+    def test_clear_history_empties_all_caches(self, client):
+        """Test that DELETE /history clears every cached response."""
+        client.get("/api/v1/alerts/history")
+        client.get("/api/v1/alerts/summary")
+        client.get("/api/v1/alerts/status")
+        assert len(alert_history_routes._history_cache) == 1
+        assert len(alert_history_routes._summary_cache) == 1
+        assert len(alert_history_routes._status_cache) == 1
+
+        response = client.delete("/api/v1/alerts/history")
+
+        assert response.status_code == 200
+        assert len(alert_history_routes._history_cache) == 0
+        assert len(alert_history_routes._summary_cache) == 0
+        assert len(alert_history_routes._status_cache) == 0
+
+        # Same alert count as before the clear, but fresh data
+        alert_history_service.add_alert(make_alert("MSFT"))
+        alerts = client.get("/api/v1/alerts/history").json()["alerts"]
+        assert [alert["symbol"] for alert in alerts] == ["MSFT"]
@@ -11,7 +11,9 @@ from decimal import Decimal
 from datetime import datetime
 from unittest.mock import Mock, patch, AsyncMock
 
-from app.services.stock_service import StockService, StockQuote
+import pandas as pd
+
+from app.services.stock_service import StockService, StockQuote, FALLBACK_QUOTE_CONCURRENCY
 from app.models.stock import StockPrice, StockAlert
 
 
@@ -92,10 +94,10 @@ class TestStockService:
         
         assert isinstance(price_record, StockPrice)
         assert price_record.symbol == "AAPL"
-        assert price_record.price == Decimal("150.00")
+        assert price_record.price == 150.0
         assert price_record.volume == 1000000
-        assert price_record.change == Decimal("2.50")
-        assert price_record.change_percent == Decimal("1.69")
+        assert price_record.change == 2.5
+        assert price_record.change_percent == 1.69
     
     def test_create_stock_alert(self, stock_service):
         """Test creating StockAlert record."""
@@ -113,9 +115,9 @@ class TestStockService:
         
         assert isinstance(alert, StockAlert)
         assert alert.symbol == "AAPL"
-        assert alert.previous_price == Decimal("147.50")
-        assert alert.current_price == Decimal("150.00")
-        assert alert.threshold_percent == Decimal("5.0")
+        assert alert.previous_price == 147.5
+        assert alert.current_price == 150.0
+        assert alert.threshold_percent == 5.0
         assert alert.alert_message == "AAPL showed strong performance"
         assert alert.news_summary == "Apple reported strong earnings"
     
@@ -143,7 +145,7 @@ class TestStockService:
     def test_clear_cache(self, stock_service):
         """Test clearing the price cache."""
         # Add some mock data to cache
-        stock_service._cache["test_key"] = (Mock(), datetime.utcnow())
+        stock_service._cache["test_key"] = Mock()
         
         stock_service.clear_cache()
         
@@ -151,18 +153,169 @@ class TestStockService:
     
     def test_get_cache_stats(self, stock_service):
         """Test getting cache statistics."""
-        # Add some mock data to cache
-        now = datetime.utcnow()
-        stock_service._cache["valid_key"] = (Mock(), now)
-        stock_service._cache["expired_key"] = (Mock(), now.replace(year=2020))
+        # Add some mock data to cache and record a hit and a miss
+        stock_service._cache["quote_AAPL"] = Mock()
+        stock_service._cache["quote_MSFT"] = Mock()
+        stock_service._get_cached_quote("quote_AAPL")
+        stock_service._get_cached_quote("quote_TSLA")
         
         stats = stock_service.get_cache_stats()
         
-        assert "total_entries" in stats
-        assert "valid_entries" in stats
-        assert "expired_entries" in stats
-        assert "cache_ttl_seconds" in stats
         assert stats["total_entries"] == 2
+        assert stats["max_entries"] == 512
+        assert stats["cache_ttl_seconds"] == 60
+        assert stats["cache_hits"] == 1
+        assert stats["cache_misses"] == 1
+        assert "valid_entries" not in stats
+        assert "expired_entries" not in stats
+
+
+
+def make_daily_bars(closes, volumes=None):
+    """Build a yfinance-style daily OHLCV frame for one ticker."""
+    volumes = volumes if volumes is not None else [1000000] * len(closes)
+    return pd.DataFrame(
+        {
+            "Open": [close - 1 for close in closes],
+            "High": [close + 2 for close in closes],
+            "Low": [close - 2 for close in closes],
+            "Close": closes,
+            "Adj Close": closes,
+            "Volume": volumes,
+        },
+        index=pd.date_range("2025-09-02", periods=len(closes), freq="D"),
+    )
+
+
+def make_download_frame(bars_by_ticker):
+    """Combine per-ticker frames the way yf.download(group_by='ticker') does."""
+    return pd.concat(bars_by_ticker, axis=1)
+
+
+class TestStockServiceBatchQuotes:
+    """Test cases for the batched yf.download quote path."""
+    
+    @pytest.fixture
+    def stock_service(self):
+        """Create a StockService instance for testing."""
+        return StockService()
+    
+    @pytest.mark.asyncio
+    async def test_two_ticker_frame(self, stock_service):
+        """Test pricing two tickers from one downloaded frame."""
+        frame = make_download_frame({
+            "AAPL": make_daily_bars([100.0, 110.0]),
+            "MSFT": make_daily_bars([200.0, 190.0]),
+        })
+        
+        with patch("app.services.stock_service.yf.download", return_value=frame) as mock_download, \
+                patch.object(stock_service, "get_stock_quote", new_callable=AsyncMock) as mock_single:
+            quotes = await stock_service.get_stock_quotes(["AAPL", "MSFT"])
+        
+        mock_download.assert_called_once()
+        mock_single.assert_not_called()
+        assert quotes["AAPL"].price == Decimal("110.0")
+        assert quotes["AAPL"].previous_close == Decimal("100.0")
+        assert quotes["AAPL"].change_percent == Decimal("10")
+        assert quotes["AAPL"].high == Decimal("112.0")
+        assert quotes["MSFT"].price == Decimal("190.0")
+        assert quotes["MSFT"].change == Decimal("-10.0")
+        # Batch results are cached for later single-symbol lookups
+        assert "quote_AAPL" in stock_service._cache
+        assert "quote_MSFT" in stock_service._cache
+    
+    @pytest.mark.asyncio
+    async def test_missing_ticker_falls_back(self, stock_service):
+        """Test that a ticker missing from the frame is fetched on its own."""
+        frame = make_download_frame({"AAPL": make_daily_bars([100.0, 110.0])})
+        mock_quote = Mock(symbol="MSFT")
+        
+        with patch("app.services.stock_service.yf.download", return_value=frame), \
+                patch.object(stock_service, "get_stock_quote", new_callable=AsyncMock,
+                             return_value=mock_quote) as mock_single:
+            quotes = await stock_service.get_stock_quotes(["AAPL", "MSFT"])
+        
+        mock_single.assert_awaited_once_with("MSFT")
+        assert quotes["AAPL"].price == Decimal("110.0")
+        assert quotes["MSFT"] is mock_quote
+    
+    @pytest.mark.asyncio
+    async def test_fallback_runs_concurrently_with_limit(self, stock_service):
+        """Test that missed tickers are fetched side by side, but only a few at a time."""
+        symbols = [f"SYM{i}" for i in range(25)]
+        running = 0
+        peak = 0
+        
+        async def fake_quote(symbol):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return None if symbol == "SYM3" else Mock(symbol=symbol)
+        
+        with patch("app.services.stock_service.yf.download", return_value=pd.DataFrame()), \
+                patch.object(stock_service, "get_stock_quote", side_effect=fake_quote) as mock_single:
+            quotes = await stock_service.get_stock_quotes(symbols)
+        
+        assert mock_single.call_count == 25
+        assert 1 < peak <= FALLBACK_QUOTE_CONCURRENCY
+        assert list(quotes) == symbols
+        assert quotes["SYM3"] is None
+        assert quotes["SYM7"].symbol == "SYM7"
+    
+    @pytest.mark.asyncio
+    async def test_one_row_history(self, stock_service):
+        """Test that a single daily bar uses its own close as previous close."""
+        frame = make_download_frame({
+            "AAPL": make_daily_bars([100.0]),
+            "MSFT": make_daily_bars([200.0]),
+        })
+        
+        with patch("app.services.stock_service.yf.download", return_value=frame), \
+                patch.object(stock_service, "get_stock_quote", new_callable=AsyncMock) as mock_single:
+            quotes = await stock_service.get_stock_quotes(["AAPL", "MSFT"])
+        
+        mock_single.assert_not_called()
+        
+        assert quotes["AAPL"].price == Decimal("100.0")
+        assert quotes["AAPL"].previous_close == Decimal("100.0")
+        assert quotes["AAPL"].change == Decimal("0")
+        assert quotes["AAPL"].change_percent == Decimal("0")
+    
+    @pytest.mark.asyncio
+    async def test_nan_volume(self, stock_service):
+        """Test that a missing (NaN) volume is reported as 0."""
+        frame = make_download_frame({
+            "AAPL": make_daily_bars([100.0, 110.0], volumes=[1000.0, float("nan")]),
+            "MSFT": make_daily_bars([200.0, 190.0]),
+        })
+        
+        with patch("app.services.stock_service.yf.download", return_value=frame), \
+                patch.object(stock_service, "get_stock_quote", new_callable=AsyncMock) as mock_single:
+            quotes = await stock_service.get_stock_quotes(["AAPL", "MSFT"])
+        
+        mock_single.assert_not_called()
+        
+        assert quotes["AAPL"].volume == 0
+        assert quotes["MSFT"].volume == 1000000
+    
+    @pytest.mark.asyncio
+    async def test_nan_high_low_open(self, stock_service):
+        """Test that missing (NaN) high, low and open fall back to the close."""
+        bars = make_daily_bars([100.0, 110.0])
+        bars.loc[bars.index[-1], ["High", "Low", "Open"]] = float("nan")
+        frame = make_download_frame({"AAPL": bars})
+        
+        with patch("app.services.stock_service.yf.download", return_value=frame), \
+                patch.object(stock_service, "get_stock_quote", new_callable=AsyncMock) as mock_single:
+            quotes = await stock_service.get_stock_quotes(["AAPL"])
+        
+        mock_single.assert_not_called()
+        
+        assert quotes["AAPL"].high == Decimal("110.0")
+        assert quotes["AAPL"].low == Decimal("110.0")
+        assert quotes["AAPL"].open_price == Decimal("110.0")
 
 
 class TestStockQuote:
@@ -210,10 +363,10 @@ class TestStockPrice:
         )
         
         assert price.symbol == "AAPL"
-        assert price.price == Decimal("150.00")
+        assert price.price == 150.0
         assert price.volume == 1000000
-        assert price.change == Decimal("2.50")
-        assert price.change_percent == Decimal("1.69")
+        assert price.change == 2.5
+        assert price.change_percent == 1.69
         assert isinstance(price.timestamp, datetime)
     
     def test_stock_price_validation(self):
@@ -224,7 +377,7 @@ class TestStockPrice:
             price=Decimal("150.00"),
             timestamp=datetime.utcnow()
         )
-        assert price.price == Decimal("150.00")
+        assert price.price == 150.0
         
         # Test negative price (should raise validation error)
         with pytest.raises(ValueError):
@@ -250,10 +403,10 @@ class TestStockAlert:
         )
         
         assert alert.symbol == "AAPL"
-        assert alert.previous_price == Decimal("147.50")
-        assert alert.current_price == Decimal("150.00")
-        assert alert.change_percent == Decimal("1.69")
-        assert alert.threshold_percent == Decimal("5.0")
+        assert alert.previous_price == 147.5
+        assert alert.current_price == 150.0
+        assert alert.change_percent == 1.69
+        assert alert.threshold_percent == 5.0
         assert alert.alert_message == "AAPL showed strong performance"
         assert alert.is_sent is False
         assert isinstance(alert.created_at, datetime)
@@ -269,7 +422,7 @@ class TestStockAlert:
             threshold_percent=Decimal("5.0"),
             alert_message="Test alert"
         )
-        assert alert.threshold_percent == Decimal("5.0")
+        assert alert.threshold_percent == 5.0
         
         # Test invalid threshold (should raise validation error)
         with pytest.raises(ValueError):